@@ -0,0 +1,36 @@
+"""Composite (job_id, created_at DESC) index on sync_logs
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Logs are always read per job, newest first; the composite index serves
+    # both the filter and the ORDER BY without a sort step.
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sync_logs_job_created 
+        ON sync_logs(job_id, created_at DESC)
+    """)
+    
+    op.execute("DROP INDEX IF EXISTS idx_sync_logs_job_id")
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sync_logs_job_id 
+        ON sync_logs(job_id)
+    """)
+    
+    op.execute("DROP INDEX IF EXISTS idx_sync_logs_job_created")
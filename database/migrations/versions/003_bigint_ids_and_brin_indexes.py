@@ -0,0 +1,44 @@
+"""BIGINT ids for sync_state/sync_logs and BRIN indexes on timestamps
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Widen SERIAL ids to BIGINT so high-volume log tables cannot wrap
+    for table in ('sync_logs', 'sync_state'):
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id TYPE BIGINT")
+        op.execute(f"ALTER SEQUENCE {table}_id_seq AS BIGINT")
+    
+    # Timestamps are append-ordered, so BRIN indexes stay tiny while still
+    # pruning date-range filters
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sync_logs_created_brin 
+        ON sync_logs USING BRIN (created_at) WITH (pages_per_range = 32)
+    """)
+    
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sync_state_synced_brin 
+        ON sync_state USING BRIN (last_synced_at) WITH (pages_per_range = 32)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_sync_state_synced_brin")
+    op.execute("DROP INDEX IF EXISTS idx_sync_logs_created_brin")
+    
+    for table in ('sync_logs', 'sync_state'):
+        op.execute(f"ALTER SEQUENCE {table}_id_seq AS INTEGER")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id TYPE INTEGER")
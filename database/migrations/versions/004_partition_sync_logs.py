@@ -0,0 +1,117 @@
+"""Partition sync_logs by month on created_at
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Move the existing table aside, keeping its id sequence alive
+    op.execute("ALTER TABLE sync_logs RENAME TO sync_logs_legacy")
+    op.execute("ALTER TABLE sync_logs_legacy RENAME CONSTRAINT sync_logs_pkey TO sync_logs_legacy_pkey")
+    op.execute("ALTER SEQUENCE sync_logs_id_seq OWNED BY NONE")
+    op.execute("DROP INDEX IF EXISTS idx_sync_logs_job_created")
+    op.execute("DROP INDEX IF EXISTS idx_sync_logs_created_brin")
+    
+    # The partition key must be part of the primary key
+    op.execute("""
+        CREATE TABLE sync_logs (
+            id BIGINT NOT NULL DEFAULT nextval('sync_logs_id_seq'),
+            job_id UUID NOT NULL REFERENCES sync_jobs(job_id),
+            keep_note_id VARCHAR(255),
+            level VARCHAR(20) NOT NULL,
+            message TEXT NOT NULL,
+            created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute("ALTER SEQUENCE sync_logs_id_seq OWNED BY sync_logs.id")
+    
+    op.execute("CREATE TABLE sync_logs_default PARTITION OF sync_logs DEFAULT")
+    
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sync_logs_job_created 
+        ON sync_logs(job_id, created_at DESC)
+    """)
+    
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sync_logs_created_brin 
+        ON sync_logs USING BRIN (created_at) WITH (pages_per_range = 32)
+    """)
+    
+    # Creates the monthly partition containing month_start; intended to be
+    # run ahead of time (e.g. from pg_cron) so rows never land in the default
+    # partition for a month that later needs its own partition.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ensure_sync_logs_partition(month_start DATE)
+        RETURNS VOID AS $$
+        DECLARE
+            range_start DATE := date_trunc('month', month_start)::DATE;
+            range_end DATE := (date_trunc('month', month_start) + INTERVAL '1 month')::DATE;
+            partition_name TEXT := 'sync_logs_' || to_char(range_start, 'YYYY_MM');
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF sync_logs FOR VALUES FROM (%L) TO (%L)',
+                partition_name, range_start, range_end
+            );
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    
+    op.execute("""
+        DO $$
+        BEGIN
+            FOR i IN 0..2 LOOP
+                PERFORM ensure_sync_logs_partition((CURRENT_DATE + make_interval(months => i))::DATE);
+            END LOOP;
+        END;
+        $$
+    """)
+    
+    op.execute("INSERT INTO sync_logs SELECT * FROM sync_logs_legacy")
+    op.execute("DROP TABLE sync_logs_legacy")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE sync_logs RENAME TO sync_logs_partitioned")
+    op.execute("ALTER TABLE sync_logs_partitioned RENAME CONSTRAINT sync_logs_pkey TO sync_logs_partitioned_pkey")
+    op.execute("ALTER SEQUENCE sync_logs_id_seq OWNED BY NONE")
+    op.execute("DROP INDEX IF EXISTS idx_sync_logs_job_created")
+    op.execute("DROP INDEX IF EXISTS idx_sync_logs_created_brin")
+    
+    op.execute("""
+        CREATE TABLE sync_logs (
+            id BIGINT PRIMARY KEY DEFAULT nextval('sync_logs_id_seq'),
+            job_id UUID NOT NULL REFERENCES sync_jobs(job_id),
+            keep_note_id VARCHAR(255),
+            level VARCHAR(20) NOT NULL,
+            message TEXT NOT NULL,
+            created_at TIMESTAMP NOT NULL DEFAULT NOW()
+        )
+    """)
+    op.execute("ALTER SEQUENCE sync_logs_id_seq OWNED BY sync_logs.id")
+    
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sync_logs_job_created 
+        ON sync_logs(job_id, created_at DESC)
+    """)
+    
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sync_logs_created_brin 
+        ON sync_logs USING BRIN (created_at) WITH (pages_per_range = 32)
+    """)
+    
+    op.execute("INSERT INTO sync_logs SELECT * FROM sync_logs_partitioned")
+    op.execute("DROP TABLE sync_logs_partitioned CASCADE")
+    op.execute("DROP FUNCTION IF EXISTS ensure_sync_logs_partition(DATE)")
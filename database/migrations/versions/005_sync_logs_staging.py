@@ -0,0 +1,49 @@
+"""Unlogged staging table for burst sync_logs writes
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Unlogged: no WAL on insert; contents are lost on crash, so only use it
+    # for log lines that are acceptable to drop.
+    op.execute("""
+        CREATE UNLOGGED TABLE IF NOT EXISTS sync_logs_staging 
+        (LIKE sync_logs INCLUDING DEFAULTS)
+    """)
+    
+    # Moves staged rows into sync_logs in one statement. DELETE ... RETURNING
+    # (rather than TRUNCATE) keeps rows staged during the flush.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION flush_sync_logs_staging()
+        RETURNS BIGINT AS $$
+        DECLARE
+            moved_count BIGINT;
+        BEGIN
+            WITH moved AS (
+                DELETE FROM sync_logs_staging RETURNING *
+            )
+            INSERT INTO sync_logs SELECT * FROM moved;
+            GET DIAGNOSTICS moved_count = ROW_COUNT;
+            RETURN moved_count;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+
+def downgrade() -> None:
+    op.execute("SELECT flush_sync_logs_staging()")
+    op.execute("DROP FUNCTION IF EXISTS flush_sync_logs_staging()")
+    op.execute("DROP TABLE IF EXISTS sync_logs_staging")
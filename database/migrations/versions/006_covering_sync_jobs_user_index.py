@@ -0,0 +1,35 @@
+"""Covering index for the per-user sync_jobs listing
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # INCLUDE the listed columns so job listings can be served by an
+    # index-only scan without heap fetches
+    op.execute("DROP INDEX IF EXISTS idx_sync_jobs_user_created")
+    op.execute("""
+        CREATE INDEX idx_sync_jobs_user_created 
+        ON sync_jobs(user_id, created_at DESC) 
+        INCLUDE (status, total_notes, processed_notes, failed_notes, completed_at)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_sync_jobs_user_created")
+    op.execute("""
+        CREATE INDEX idx_sync_jobs_user_created 
+        ON sync_jobs(user_id, created_at DESC)
+    """)
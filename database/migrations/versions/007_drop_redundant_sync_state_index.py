@@ -0,0 +1,28 @@
+"""Drop idx_sync_state_user_note, a duplicate of the UNIQUE constraint
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # UNIQUE (user_id, keep_note_id) already maintains a btree on the same key
+    op.execute("DROP INDEX IF EXISTS idx_sync_state_user_note")
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sync_state_user_note 
+        ON sync_state(user_id, keep_note_id)
+    """)
@@ -0,0 +1,50 @@
+"""Store sync_jobs.status and sync_logs.level as native enums
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 'cancelled' is written by the Sync Service abort endpoint
+    op.execute("""
+        CREATE TYPE sync_status AS ENUM ('queued', 'running', 'completed', 'failed', 'cancelled')
+    """)
+    op.execute("""
+        CREATE TYPE sync_log_level AS ENUM ('INFO', 'WARNING', 'ERROR')
+    """)
+    
+    # Rewrites the tables and rebuilds indexes that reference the columns
+    op.execute("""
+        ALTER TABLE sync_jobs 
+        ALTER COLUMN status TYPE sync_status USING status::sync_status
+    """)
+    op.execute("""
+        ALTER TABLE sync_logs 
+        ALTER COLUMN level TYPE sync_log_level USING level::sync_log_level
+    """)
+    
+    # flush_sync_logs_staging() copies rows column-for-column into sync_logs
+    op.execute("""
+        ALTER TABLE sync_logs_staging 
+        ALTER COLUMN level TYPE sync_log_level USING level::sync_log_level
+    """)
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE sync_logs_staging ALTER COLUMN level TYPE VARCHAR(20)")
+    op.execute("ALTER TABLE sync_logs ALTER COLUMN level TYPE VARCHAR(20)")
+    op.execute("ALTER TABLE sync_jobs ALTER COLUMN status TYPE VARCHAR(50)")
+    op.execute("DROP TYPE IF EXISTS sync_log_level")
+    op.execute("DROP TYPE IF EXISTS sync_status")
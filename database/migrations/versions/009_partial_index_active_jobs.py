@@ -0,0 +1,29 @@
+"""Partial index over active (queued/running) sync jobs
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Sized by the number of in-flight jobs rather than the job history
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sync_jobs_active 
+        ON sync_jobs(user_id, created_at DESC) 
+        WHERE status IN ('queued', 'running')
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_sync_jobs_active")
@@ -0,0 +1,41 @@
+"""Maintain credentials.updated_at with a BEFORE UPDATE trigger
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_updated_at()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.updated_at = NOW();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    
+    # Covers single-statement UPDATEs (e.g. bulk token rotation) that do not
+    # go through an ORM save()
+    op.execute("""
+        CREATE TRIGGER credentials_updated_at 
+        BEFORE UPDATE ON credentials 
+        FOR EACH ROW EXECUTE FUNCTION set_updated_at()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS credentials_updated_at ON credentials")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
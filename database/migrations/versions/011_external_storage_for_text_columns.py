@@ -0,0 +1,28 @@
+"""Store long message columns uncompressed out of line (STORAGE EXTERNAL)
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Only affects values written from now on. Recurses to existing
+    # partitions, and new partitions inherit the setting from sync_logs.
+    op.execute("ALTER TABLE sync_logs ALTER COLUMN message SET STORAGE EXTERNAL")
+    op.execute("ALTER TABLE sync_jobs ALTER COLUMN error_message SET STORAGE EXTERNAL")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE sync_jobs ALTER COLUMN error_message SET STORAGE EXTENDED")
+    op.execute("ALTER TABLE sync_logs ALTER COLUMN message SET STORAGE EXTENDED")
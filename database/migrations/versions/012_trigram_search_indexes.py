@@ -0,0 +1,41 @@
+"""Trigram GIN indexes for the admin search columns
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    
+    # Django compiles icontains to UPPER(col::text) LIKE UPPER('%q%'), so the
+    # indexes are on UPPER(col) for the admin search to use them
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sync_jobs_user_id_trgm 
+        ON sync_jobs USING GIN (UPPER(user_id) gin_trgm_ops)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sync_logs_keep_note_id_trgm 
+        ON sync_logs USING GIN (UPPER(keep_note_id) gin_trgm_ops)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sync_logs_message_trgm 
+        ON sync_logs USING GIN (UPPER(message) gin_trgm_ops)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_sync_logs_message_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_sync_logs_keep_note_id_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_sync_jobs_user_id_trgm")
@@ -0,0 +1,25 @@
+"""Default sync_jobs.job_id to gen_random_uuid()
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in since PostgreSQL 13 (no pgcrypto needed)
+    op.execute("ALTER TABLE sync_jobs ALTER COLUMN job_id SET DEFAULT gen_random_uuid()")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE sync_jobs ALTER COLUMN job_id DROP DEFAULT")
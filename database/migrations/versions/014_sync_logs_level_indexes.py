@@ -0,0 +1,36 @@
+"""Indexes for filtering sync_logs by level, newest first
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Error triage: small, since only ERROR rows are indexed
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sync_logs_errors 
+        ON sync_logs(created_at DESC) 
+        WHERE level = 'ERROR'
+    """)
+    
+    # Other levels (e.g. WARNING) filtered in the admin
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sync_logs_level_created 
+        ON sync_logs(level, created_at DESC)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_sync_logs_level_created")
+    op.execute("DROP INDEX IF EXISTS idx_sync_logs_errors")
@@ -0,0 +1,35 @@
+"""Indexes for filtering and paging sync_jobs by status and created_at
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Job list filtered by status, newest first; dashboard per-status counts
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sync_jobs_status_created 
+        ON sync_jobs(status, created_at DESC)
+    """)
+    
+    # Unfiltered job list pages and the dashboard's last-24h count
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sync_jobs_created 
+        ON sync_jobs(created_at DESC)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_sync_jobs_created")
+    op.execute("DROP INDEX IF EXISTS idx_sync_jobs_status_created")
@@ -1,10 +1,30 @@
 -- PostgreSQL Database Schema for Google Keep to Notion Sync
 
+-- Trigram operator classes for the admin substring search indexes
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Enumerated column types ('cancelled' is written by the Sync Service abort endpoint)
+DO $$
+BEGIN
+    CREATE TYPE sync_status AS ENUM ('queued', 'running', 'completed', 'failed', 'cancelled');
+EXCEPTION
+    WHEN duplicate_object THEN NULL;
+END;
+$$;
+
+DO $$
+BEGIN
+    CREATE TYPE sync_log_level AS ENUM ('INFO', 'WARNING', 'ERROR');
+EXCEPTION
+    WHEN duplicate_object THEN NULL;
+END;
+$$;
+
 -- Sync Jobs Table
 CREATE TABLE IF NOT EXISTS sync_jobs (
-    job_id UUID PRIMARY KEY,
+    job_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     user_id VARCHAR(255) NOT NULL,
-    status VARCHAR(50) NOT NULL,
+    status sync_status NOT NULL,
     full_sync BOOLEAN DEFAULT FALSE,
     total_notes INTEGER DEFAULT 0,
     processed_notes INTEGER DEFAULT 0,
@@ -14,11 +34,21 @@ CREATE TABLE IF NOT EXISTS sync_jobs (
     completed_at TIMESTAMP
 );
 
-CREATE INDEX IF NOT EXISTS idx_sync_jobs_user_created ON sync_jobs(user_id, created_at DESC);
+-- Long values are moved out of line uncompressed, so reading them needs no decompression
+ALTER TABLE sync_jobs ALTER COLUMN error_message SET STORAGE EXTERNAL;
+
+CREATE INDEX IF NOT EXISTS idx_sync_jobs_user_created ON sync_jobs(user_id, created_at DESC)
+    INCLUDE (status, total_notes, processed_notes, failed_notes, completed_at);
+CREATE INDEX IF NOT EXISTS idx_sync_jobs_active ON sync_jobs(user_id, created_at DESC)
+    WHERE status IN ('queued', 'running');
+CREATE INDEX IF NOT EXISTS idx_sync_jobs_status_created ON sync_jobs(status, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_sync_jobs_created ON sync_jobs(created_at DESC);
+-- Admin search: Django's icontains compiles to UPPER(col::text) LIKE UPPER('%q%')
+CREATE INDEX IF NOT EXISTS idx_sync_jobs_user_id_trgm ON sync_jobs USING GIN (UPPER(user_id) gin_trgm_ops);
 
 -- Sync State Table
 CREATE TABLE IF NOT EXISTS sync_state (
-    id SERIAL PRIMARY KEY,
+    id BIGSERIAL PRIMARY KEY,
     user_id VARCHAR(255) NOT NULL,
     keep_note_id VARCHAR(255) NOT NULL,
     notion_page_id VARCHAR(255) NOT NULL,
@@ -27,7 +57,7 @@ CREATE TABLE IF NOT EXISTS sync_state (
     UNIQUE (user_id, keep_note_id)
 );
 
-CREATE INDEX IF NOT EXISTS idx_sync_state_user_note ON sync_state(user_id, keep_note_id);
+CREATE INDEX IF NOT EXISTS idx_sync_state_synced_brin ON sync_state USING BRIN (last_synced_at) WITH (pages_per_range = 32);
 
 -- Credentials Table
 CREATE TABLE IF NOT EXISTS credentials (
@@ -38,14 +68,77 @@ CREATE TABLE IF NOT EXISTS credentials (
     updated_at TIMESTAMP NOT NULL DEFAULT NOW()
 );
 
--- Sync Logs Table
+CREATE OR REPLACE FUNCTION set_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS credentials_updated_at ON credentials;
+CREATE TRIGGER credentials_updated_at BEFORE UPDATE ON credentials
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+-- Sync Logs Table (partitioned by month on created_at)
 CREATE TABLE IF NOT EXISTS sync_logs (
-    id SERIAL PRIMARY KEY,
+    id BIGSERIAL,
     job_id UUID NOT NULL REFERENCES sync_jobs(job_id),
     keep_note_id VARCHAR(255),
-    level VARCHAR(20) NOT NULL,
+    level sync_log_level NOT NULL,
     message TEXT NOT NULL,
-    created_at TIMESTAMP NOT NULL DEFAULT NOW()
-);
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+ALTER TABLE sync_logs ALTER COLUMN message SET STORAGE EXTERNAL;
+
+CREATE TABLE IF NOT EXISTS sync_logs_default PARTITION OF sync_logs DEFAULT;
+
+CREATE INDEX IF NOT EXISTS idx_sync_logs_job_created ON sync_logs(job_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_sync_logs_level_created ON sync_logs(level, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_sync_logs_errors ON sync_logs(created_at DESC) WHERE level = 'ERROR';
+CREATE INDEX IF NOT EXISTS idx_sync_logs_created_brin ON sync_logs USING BRIN (created_at) WITH (pages_per_range = 32);
+CREATE INDEX IF NOT EXISTS idx_sync_logs_keep_note_id_trgm ON sync_logs USING GIN (UPPER(keep_note_id) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_sync_logs_message_trgm ON sync_logs USING GIN (UPPER(message) gin_trgm_ops);
+
+-- Creates the monthly sync_logs partition containing month_start.
+-- Run ahead of each month (e.g. via pg_cron) so rows do not pile up in the default partition.
+CREATE OR REPLACE FUNCTION ensure_sync_logs_partition(month_start DATE)
+RETURNS VOID AS $$
+DECLARE
+    range_start DATE := date_trunc('month', month_start)::DATE;
+    range_end DATE := (date_trunc('month', month_start) + INTERVAL '1 month')::DATE;
+    partition_name TEXT := 'sync_logs_' || to_char(range_start, 'YYYY_MM');
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF sync_logs FOR VALUES FROM (%L) TO (%L)',
+        partition_name, range_start, range_end
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+BEGIN
+    FOR i IN 0..2 LOOP
+        PERFORM ensure_sync_logs_partition((CURRENT_DATE + make_interval(months => i))::DATE);
+    END LOOP;
+END;
+$$;
+
+-- Unlogged staging table for burst log writes; flushed into sync_logs in the background
+CREATE UNLOGGED TABLE IF NOT EXISTS sync_logs_staging (LIKE sync_logs INCLUDING DEFAULTS);
 
-CREATE INDEX IF NOT EXISTS idx_sync_logs_job_id ON sync_logs(job_id);
+CREATE OR REPLACE FUNCTION flush_sync_logs_staging()
+RETURNS BIGINT AS $$
+DECLARE
+    moved_count BIGINT;
+BEGIN
+    WITH moved AS (
+        DELETE FROM sync_logs_staging RETURNING *
+    )
+    INSERT INTO sync_logs SELECT * FROM moved;
+    GET DIAGNOSTICS moved_count = ROW_COUNT;
+    RETURN moved_count;
+END;
+$$ LANGUAGE plpgsql;
@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'admin_project.settings')
 
 application = get_asgi_application()
+
+# See wsgi.py: each worker probes system health in the background
+from sync_admin.tasks import start_health_monitor  # noqa: E402
+
+start_health_monitor()
@@ -106,6 +106,12 @@ if DATABASE_URL.startswith('postgresql://'):
                 'PASSWORD': db_password,
                 'HOST': db_host,
                 'PORT': db_port,
+                # Persistent connections only help a WSGI server. Under ASGI
+                # each request runs its ORM code in a new thread, so kept
+                # connections are never reused and pile up; 0 closes them
+                # at the end of every request
+                'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '0')),
+                'CONN_HEALTH_CHECKS': True,
             }
         }
     else:
@@ -124,6 +130,18 @@ else:
         }
     }
 
+# Tests run against an in-memory SQLite database: creating its schema is
+# fast and nothing is written to disk. Set TEST_USE_CONFIGURED_DB=1 (e.g. in
+# CI) to run them against DATABASE_URL instead.
+RUNNING_TESTS = sys.argv[1:2] == ['test'] or 'pytest' in sys.modules
+if RUNNING_TESTS and not os.getenv('TEST_USE_CONFIGURED_DB'):
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:',
+        }
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -22,10 +22,13 @@ urlpatterns = [
     path('', views.dashboard, name='dashboard'),
     path('admin/', admin.site.urls),
     path('sync-jobs/', views.sync_job_list, name='sync_job_list'),
+    path('sync-jobs/retry/', views.bulk_retry_sync_jobs, name='bulk_retry_sync_jobs'),
     path('sync-jobs/<uuid:job_id>/', views.sync_job_detail, name='sync_job_detail'),
+    path('sync-jobs/<uuid:job_id>/logs/tail/', views.sync_job_log_tail, name='sync_job_log_tail'),
     path('sync-jobs/<uuid:job_id>/retry/', views.retry_sync_job, name='retry_sync_job'),
     path('sync-jobs/<uuid:job_id>/abort/', views.abort_sync_job, name='abort_sync_job'),
     path('sync/trigger/', views.manual_sync_trigger, name='manual_sync_trigger'),
+    path('sync/trigger/all/', views.bulk_manual_sync_trigger, name='bulk_manual_sync_trigger'),
     path('config/credentials/', views.credential_config, name='credential_config'),
     path('config/credentials/<str:user_id>/clear-sync-state/', views.clear_sync_state, name='clear_sync_state'),
 ]
@@ -14,3 +14,10 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'admin_project.settings')
 
 application = get_wsgi_application()
+
+# Probe system health in the background so the dashboard never waits on it.
+# Gunicorn imports this module in each worker, so every worker refreshes
+# its own (per-process) cache.
+from sync_admin.tasks import start_health_monitor  # noqa: E402
+
+start_health_monitor()
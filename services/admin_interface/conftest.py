@@ -0,0 +1,10 @@
+"""
+Shared pytest configuration for the admin interface tests.
+
+pytest-django sets up Django once per session from this settings module, so
+the test modules do not bootstrap Django themselves.
+"""
+
+import os
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'admin_project.settings')
@@ -1,20 +1,148 @@
 """Django admin configuration for sync_admin models."""
 
+import csv
+
 from django.contrib import admin
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ALL_VAR, ORDER_VAR, ChangeList
+from django.contrib.admin.widgets import AdminTextareaWidget
+from django.http import StreamingHttpResponse
+from django.db import models
+from django.db.models import Case, CharField, Value, When
+from django.db.models.functions import Concat, Length, Substr
 from .models import SyncJob, SyncState, Credential, SyncLog
+from .pagination import decode_cursor, encode_cursor, older_than
+
+
+CURSOR_VAR = 'cursor'
+
+
+class CursorChangeList(ChangeList):
+    """
+    ChangeList that pages newest-first by (created_at, pk) instead of OFFSET.
+    
+    Each page filters on the last row of the previous one, so deep pages cost
+    the same index seek as the first. Falls back to numbered pages when the
+    list is sorted by another column or "Show all" is requested.
+    """
+    
+    is_keyset = True
+    
+    def __init__(self, request, *args, **kwargs):
+        self.cursor = request.GET.get(CURSOR_VAR)
+        self.next_cursor_url = None
+        super().__init__(request, *args, **kwargs)
+    
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+    
+    def get_query_string(self, new_params=None, remove=None):
+        # Changing filters, search or sorting starts again from the first page
+        return super().get_query_string(new_params, [CURSOR_VAR, *(remove or [])])
+    
+    def get_results(self, request):
+        if ORDER_VAR in self.params or ALL_VAR in self.params:
+            self.is_keyset = False
+            return super().get_results(request)
+        
+        # Keyset pages never COUNT the table: the paginator is built but not
+        # evaluated, and the attributes ChangeList.get_results would derive
+        # from counts are set from the page itself
+        self.paginator = self.model_admin.get_paginator(
+            request, self.queryset, self.list_per_page
+        )
+        self.show_full_result_count = False
+        self.full_result_count = None
+        self.show_admin_actions = True
+        # multi_page and can_show_all drive the numbered page links and the
+        # "Show all" link, which keyset pages replace with cursor links
+        self.multi_page = False
+        self.can_show_all = False
+        
+        queryset = self.queryset
+        if self.cursor:
+            try:
+                queryset = older_than(queryset, *decode_cursor(self.cursor, self.model))
+            except ValueError:
+                raise IncorrectLookupParameters
+        
+        rows = list(queryset[:self.list_per_page + 1])
+        self.result_list = rows[:self.list_per_page]
+        # Actions apply to the rows on this page
+        self.result_count = len(self.result_list)
+        if len(rows) > self.list_per_page:
+            self.next_cursor_url = self.get_query_string(
+                {CURSOR_VAR: encode_cursor(self.result_list[-1])}
+            )
+
+
+class CursorPaginationMixin:
+    """Use CursorChangeList for the changelist of a model ordered by -created_at."""
+    
+    def get_changelist(self, request, **kwargs):
+        return CursorChangeList
+
+
+class _Echo:
+    """File-like object that hands each written row back to the caller."""
+    
+    def write(self, value):
+        return value
+
+
+class ActiveJobFilter(admin.SimpleListFilter):
+    """Filter jobs that are still queued or running (served by idx_sync_jobs_active)."""
+    
+    title = 'activity'
+    parameter_name = 'active'
+    
+    def lookups(self, request, model_admin):
+        return [('yes', 'Active')]
+    
+    def queryset(self, request, queryset):
+        if self.value() == 'yes':
+            return queryset.filter(status__in=['queued', 'running'])
+        return queryset
 
 
 @admin.register(SyncJob)
-class SyncJobAdmin(admin.ModelAdmin):
+class SyncJobAdmin(CursorPaginationMixin, admin.ModelAdmin):
     """Admin interface for SyncJob model."""
     
     list_display = ['job_id', 'user_id', 'status', 'total_notes', 'processed_notes', 
                     'failed_notes', 'created_at', 'completed_at']
-    list_filter = ['status', 'full_sync', 'created_at']
+    list_filter = [ActiveJobFilter, 'status', 'full_sync', 'created_at']
     search_fields = ['job_id', 'user_id']
     readonly_fields = ['job_id', 'created_at', 'completed_at']
     ordering = ['-created_at']
     
+    actions = ['export_logs']
+    
+    def get_queryset(self, request):
+        """Skip the error_message TEXT column, which is not shown in list_display."""
+        return super().get_queryset(request).defer('error_message')
+    
+    @admin.action(description='Export logs of selected jobs as CSV')
+    def export_logs(self, request, queryset):
+        """Stream the logs of the selected jobs as a CSV download."""
+        job_ids = list(queryset.values_list('job_id', flat=True))
+        writer = csv.writer(_Echo())
+        
+        def rows():
+            yield writer.writerow(['job_id', 'created_at', 'level', 'keep_note_id', 'message'])
+            for job_id in job_ids:
+                for log in SyncLog.objects.stream_for_job(job_id):
+                    yield writer.writerow([
+                        log.job_id, log.created_at.isoformat(), log.level,
+                        log.keep_note_id or '', log.message,
+                    ])
+        
+        response = StreamingHttpResponse(rows(), content_type='text/csv')
+        response['Content-Disposition'] = 'attachment; filename="sync_logs.csv"'
+        return response
+    
     fieldsets = (
         ('Job Information', {
             'fields': ('job_id', 'user_id', 'status', 'full_sync')
@@ -52,6 +180,11 @@ class CredentialAdmin(admin.ModelAdmin):
     search_fields = ['user_id', 'notion_database_id']
     readonly_fields = ['updated_at']
     
+    # The only TextFields on Credential are the two encrypted tokens.
+    formfield_overrides = {
+        models.TextField: {'widget': AdminTextareaWidget(attrs={'style': 'width: 600px;'})},
+    }
+    
     fieldsets = (
         ('User Information', {
             'fields': ('user_id',)
@@ -68,37 +201,47 @@ class CredentialAdmin(admin.ModelAdmin):
             'fields': ('updated_at',)
         }),
     )
-    
-    def get_form(self, request, obj=None, **kwargs):
-        """Customize form to show password-style input for tokens."""
-        form = super().get_form(request, obj, **kwargs)
-        if 'google_oauth_token' in form.base_fields:
-            form.base_fields['google_oauth_token'].widget.attrs['style'] = 'width: 600px;'
-        if 'notion_api_token' in form.base_fields:
-            form.base_fields['notion_api_token'].widget.attrs['style'] = 'width: 600px;'
-        return form
 
 
 @admin.register(SyncLog)
-class SyncLogAdmin(admin.ModelAdmin):
+class SyncLogAdmin(CursorPaginationMixin, admin.ModelAdmin):
     """Admin interface for SyncLog model."""
     
-    list_display = ['id', 'job_id', 'level', 'keep_note_id', 'message_preview', 'created_at']
+    list_display = ['id', 'job', 'level', 'keep_note_id', 'message_preview', 'created_at']
     list_filter = ['level', 'created_at']
-    search_fields = ['job_id', 'keep_note_id', 'message']
+    list_select_related = ['job']
+    search_fields = ['job__job_id', 'keep_note_id', 'message']
+    raw_id_fields = ['job']
     readonly_fields = ['created_at']
     ordering = ['-created_at']
     
+    def get_queryset(self, request):
+        """Build the message preview in SQL so the full message is never fetched."""
+        qs = super().get_queryset(request)
+        # Only the first 101 characters are read: one past the preview is
+        # enough to tell a longer message, without detoasting all of it
+        return qs.defer('message').annotate(
+            _msg_head=Substr('message', 1, 101),
+            _msg_head_length=Length('_msg_head'),
+            _msg_preview=Concat(
+                Substr('_msg_head', 1, 100),
+                Case(
+                    When(_msg_head_length__gt=100, then=Value('...')),
+                    default=Value(''),
+                    output_field=CharField(),
+                ),
+                output_field=CharField(),
+            ),
+        )
+    
     def message_preview(self, obj):
         """Show a preview of the message."""
-        if len(obj.message) > 100:
-            return obj.message[:100] + '...'
-        return obj.message
+        return obj._msg_preview
     message_preview.short_description = 'Message'
     
     fieldsets = (
         ('Log Information', {
-            'fields': ('job_id', 'level', 'keep_note_id', 'created_at')
+            'fields': ('job', 'level', 'keep_note_id', 'created_at')
         }),
         ('Message', {
             'fields': ('message',)
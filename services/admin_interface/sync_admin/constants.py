@@ -0,0 +1,5 @@
+"""Constants shared by the sync_admin views and background tasks."""
+
+# Cache key of the health status written by the health monitor and read by
+# the dashboard
+HEALTH_CACHE_KEY = 'health:status'
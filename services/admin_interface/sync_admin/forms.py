@@ -0,0 +1,16 @@
+"""Forms for the sync_admin app."""
+
+from django import forms
+
+from .models import SyncJob
+
+
+class JobListFilterForm(forms.Form):
+    """Query-string filters of the sync job list."""
+    
+    status = forms.ChoiceField(
+        choices=[('', '-')] + list(SyncJob.STATUS_CHOICES), required=False
+    )
+    user = forms.CharField(required=False)
+    date_from = forms.DateField(required=False, input_formats=['%Y-%m-%d'])
+    date_to = forms.DateField(required=False, input_formats=['%Y-%m-%d'])
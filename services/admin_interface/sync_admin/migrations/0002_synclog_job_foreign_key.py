@@ -0,0 +1,32 @@
+# Generated by Django 4.2.9 on 2026-10-16 09:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sync_admin', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='synclog',
+            name='idx_sync_logs_job_id',
+        ),
+        migrations.RenameField(
+            model_name='synclog',
+            old_name='job_id',
+            new_name='job',
+        ),
+        migrations.AlterField(
+            model_name='synclog',
+            name='job',
+            field=models.ForeignKey(db_column='job_id', db_index=False, on_delete=django.db.models.deletion.CASCADE, to='sync_admin.syncjob'),
+        ),
+        migrations.AddIndex(
+            model_name='synclog',
+            index=models.Index(fields=['job', '-created_at'], name='idx_sync_logs_job_created'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.9 on 2026-10-16 04:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sync_admin', '0002_synclog_job_foreign_key'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='synclog',
+            name='id',
+            field=models.BigAutoField(primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='syncstate',
+            name='id',
+            field=models.BigAutoField(primary_key=True, serialize=False),
+        ),
+    ]
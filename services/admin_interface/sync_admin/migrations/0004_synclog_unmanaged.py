@@ -0,0 +1,17 @@
+# Generated by Django 4.2.9 on 2026-10-16 04:46
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sync_admin', '0003_bigint_ids'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='synclog',
+            options={'managed': False, 'ordering': ['-created_at']},
+        ),
+    ]
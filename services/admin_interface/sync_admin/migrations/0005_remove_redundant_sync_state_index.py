@@ -0,0 +1,17 @@
+# Generated by Django 4.2.9 on 2026-10-16 04:47
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sync_admin', '0004_synclog_unmanaged'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='syncstate',
+            name='idx_sync_state_user_note',
+        ),
+    ]
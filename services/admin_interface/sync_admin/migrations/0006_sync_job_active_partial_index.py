@@ -0,0 +1,17 @@
+# Generated by Django 4.2.9 on 2026-10-16 04:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sync_admin', '0005_remove_redundant_sync_state_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='syncjob',
+            index=models.Index(condition=models.Q(('status__in', ['queued', 'running'])), fields=['user_id', '-created_at'], name='idx_sync_jobs_active'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.9 on 2026-10-16 05:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sync_admin', '0006_sync_job_active_partial_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='syncjob',
+            index=models.Index(fields=['status', '-created_at'], name='idx_sync_jobs_status_created'),
+        ),
+        migrations.AddIndex(
+            model_name='syncjob',
+            index=models.Index(fields=['-created_at'], name='idx_sync_jobs_created'),
+        ),
+    ]
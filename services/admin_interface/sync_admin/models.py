@@ -4,6 +4,28 @@ from django.db import models
 import uuid
 
 
+class SyncJobQuerySet(models.QuerySet):
+    """QuerySet for SyncJob."""
+    
+    def with_recent_logs(self, limit=5):
+        """
+        Prefetch the newest log entries of each job into ``job.recent_logs``.
+        
+        Loads the logs for every job in the queryset with one extra query,
+        instead of one query per job.
+        
+        Args:
+            limit: Maximum number of log entries kept per job
+        """
+        return self.prefetch_related(
+            models.Prefetch(
+                'synclog_set',
+                queryset=SyncLog.objects.order_by('-created_at', '-id')[:limit],
+                to_attr='recent_logs',
+            )
+        )
+
+
 class SyncJob(models.Model):
     """Model for sync_jobs table."""
     
@@ -25,10 +47,19 @@ class SyncJob(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     completed_at = models.DateTimeField(null=True, blank=True)
     
+    objects = SyncJobQuerySet.as_manager()
+    
     class Meta:
         db_table = 'sync_jobs'
         indexes = [
             models.Index(fields=['user_id', '-created_at'], name='idx_sync_jobs_user_created'),
+            models.Index(fields=['status', '-created_at'], name='idx_sync_jobs_status_created'),
+            models.Index(fields=['-created_at'], name='idx_sync_jobs_created'),
+            models.Index(
+                fields=['user_id', '-created_at'],
+                name='idx_sync_jobs_active',
+                condition=models.Q(status__in=['queued', 'running']),
+            ),
         ]
         ordering = ['-created_at']
     
@@ -39,7 +70,7 @@ class SyncJob(models.Model):
 class SyncState(models.Model):
     """Model for sync_state table."""
     
-    id = models.AutoField(primary_key=True)
+    id = models.BigAutoField(primary_key=True)
     user_id = models.CharField(max_length=255)
     keep_note_id = models.CharField(max_length=255)
     notion_page_id = models.CharField(max_length=255)
@@ -49,9 +80,6 @@ class SyncState(models.Model):
     class Meta:
         db_table = 'sync_state'
         unique_together = [['user_id', 'keep_note_id']]
-        indexes = [
-            models.Index(fields=['user_id', 'keep_note_id'], name='idx_sync_state_user_note'),
-        ]
     
     def __str__(self):
         return f"SyncState {self.user_id} - {self.keep_note_id}"
@@ -64,6 +92,8 @@ class Credential(models.Model):
     google_oauth_token = models.TextField()  # Encrypted
     notion_api_token = models.TextField()    # Encrypted
     notion_database_id = models.CharField(max_length=255)
+    # Also set by the credentials_updated_at trigger in Postgres, so
+    # QuerySet.update() keeps it current without going through save().
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
@@ -73,6 +103,27 @@ class Credential(models.Model):
         return f"Credential for {self.user_id}"
 
 
+class SyncLogQuerySet(models.QuerySet):
+    """QuerySet for SyncLog."""
+    
+    def stream_for_job(self, job_id, chunk_size=2000):
+        """
+        Iterate over all log entries of a job, oldest first, in fixed-size chunks.
+        
+        Rows are fetched through a server-side cursor on Postgres, so memory
+        use stays bounded by chunk_size however many entries the job has.
+        
+        Args:
+            job_id: The job ID
+            chunk_size: Number of rows fetched from the database at a time
+        """
+        return (
+            self.filter(job_id=job_id)
+            .order_by('created_at', 'id')
+            .iterator(chunk_size=chunk_size)
+        )
+
+
 class SyncLog(models.Model):
     """Model for sync_logs table."""
     
@@ -82,19 +133,53 @@ class SyncLog(models.Model):
         ('ERROR', 'Error'),
     ]
     
-    id = models.AutoField(primary_key=True)
-    job_id = models.UUIDField()
+    id = models.BigAutoField(primary_key=True)
+    job = models.ForeignKey(
+        SyncJob,
+        on_delete=models.CASCADE,
+        db_column='job_id',
+        db_index=False,
+    )
     keep_note_id = models.CharField(max_length=255, null=True, blank=True)
     level = models.CharField(max_length=20, choices=LEVEL_CHOICES)
     message = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     
+    objects = SyncLogQuerySet.as_manager()
+    
     class Meta:
         db_table = 'sync_logs'
+        # Partitioned by month in Postgres; the table is owned by the Alembic
+        # migrations in database/, not by Django.
+        managed = False
         indexes = [
-            models.Index(fields=['job_id'], name='idx_sync_logs_job_id'),
+            models.Index(fields=['job', '-created_at'], name='idx_sync_logs_job_created'),
+            models.Index(fields=['level', '-created_at'], name='idx_sync_logs_level_created'),
+            models.Index(
+                fields=['-created_at'],
+                name='idx_sync_logs_errors',
+                condition=models.Q(level='ERROR'),
+            ),
         ]
         ordering = ['-created_at']
     
     def __str__(self):
         return f"SyncLog {self.level} - {self.job_id}"
+    
+    @classmethod
+    def bulk_log(cls, job_id, entries, batch_size=1000):
+        """
+        Insert many log entries for a job in batched INSERT statements.
+        
+        Args:
+            job_id: The job ID the entries belong to
+            entries: Iterable of dicts with level, message and optional keep_note_id
+            batch_size: Maximum number of rows per INSERT
+            
+        Returns:
+            List of created SyncLog instances
+        """
+        return cls.objects.bulk_create(
+            [cls(job_id=job_id, **entry) for entry in entries],
+            batch_size=batch_size,
+        )
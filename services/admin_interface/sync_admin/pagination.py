@@ -0,0 +1,122 @@
+"""Keyset (cursor) pagination for querysets ordered newest-first by (created_at, pk)."""
+
+from datetime import datetime
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+
+def encode_cursor(obj):
+    """Return the cursor token that points at obj."""
+    return f'{obj.created_at.isoformat()}|{obj.pk}'
+
+
+def decode_cursor(token, model):
+    """
+    Parse a cursor token into (created_at, pk).
+
+    Args:
+        token: Token produced by encode_cursor
+        model: Model class whose primary key the token refers to
+
+    Returns:
+        Tuple of (created_at, pk)
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        created_at, pk = token.split('|', 1)
+        return datetime.fromisoformat(created_at), model._meta.pk.to_python(pk)
+    except (ValueError, ValidationError) as e:
+        raise ValueError(f'Invalid cursor: {token!r}') from e
+
+
+def older_than(queryset, created_at, pk):
+    """Filter to rows that come after (created_at, pk) in newest-first order."""
+    return queryset.filter(
+        Q(created_at__lt=created_at) | Q(pk__lt=pk),
+        created_at__lte=created_at,
+    )
+
+
+def newer_than(queryset, created_at, pk):
+    """Filter to rows that come before (created_at, pk) in newest-first order."""
+    return queryset.filter(
+        Q(created_at__gt=created_at) | Q(pk__gt=pk),
+        created_at__gte=created_at,
+    )
+
+
+class KeysetPage:
+    """One page of results with cursors to its neighbours."""
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    @property
+    def has_other_pages(self):
+        return self.has_next or self.has_previous
+
+
+def paginate(queryset, per_page, after=None, before=None):
+    """
+    Return one newest-first page of queryset without counting it.
+
+    Each page is a single LIMIT per_page + 1 query that seeks from the
+    cursor, so its cost does not grow with the page's position.
+
+    Args:
+        queryset: Queryset of a model with a created_at field
+        per_page: Number of rows per page
+        after: Cursor token; return the rows following it
+        before: Cursor token; return the rows preceding it
+
+    Returns:
+        KeysetPage
+
+    Raises:
+        ValueError: If a cursor token is malformed
+    """
+    model = queryset.model
+
+    if before:
+        # Walk backwards from the cursor, then restore newest-first order
+        rows = list(
+            newer_than(queryset, *decode_cursor(before, model))
+            .order_by('created_at', 'pk')[:per_page + 1]
+        )
+        has_more = len(rows) > per_page
+        rows = rows[:per_page][::-1]
+        return KeysetPage(
+            rows,
+            next_cursor=encode_cursor(rows[-1]) if rows else None,
+            previous_cursor=encode_cursor(rows[0]) if has_more else None,
+        )
+
+    if after:
+        queryset = older_than(queryset, *decode_cursor(after, model))
+    rows = list(queryset.order_by('-created_at', '-pk')[:per_page + 1])
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    return KeysetPage(
+        rows,
+        next_cursor=encode_cursor(rows[-1]) if has_more else None,
+        previous_cursor=encode_cursor(rows[0]) if after and rows else None,
+    )
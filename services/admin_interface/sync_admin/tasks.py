@@ -0,0 +1,106 @@
+"""Background tasks for the sync_admin app."""
+
+import atexit
+import logging
+import threading
+import time
+
+import httpx
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections, connection
+
+from .constants import HEALTH_CACHE_KEY
+
+
+logger = logging.getLogger(__name__)
+
+HEALTH_REFRESH_INTERVAL = 15  # seconds
+# Outlives a couple of missed refreshes before the dashboard shows 'unknown'
+HEALTH_CACHE_TIMEOUT = 30  # seconds
+HEALTH_PROBE_TIMEOUT = 1.0  # seconds
+
+# Pooled client for the health probes. Reusing it keeps the connection to
+# the Sync Service alive between refreshes.
+_sync_client = httpx.Client(
+    base_url=settings.SYNC_SERVICE_URL,
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+)
+atexit.register(_sync_client.close)
+
+_monitor_lock = threading.Lock()
+_monitor_thread = None
+
+
+def probe_health():
+    """
+    Check the health of various system components.
+    
+    Returns:
+        dict: Health status of each component
+    """
+    health = {
+        'database': 'up',
+        'sync_service': 'unknown',
+        'overall': 'healthy',
+    }
+    
+    # Check database connectivity
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        health['database'] = 'up'
+    except Exception as e:
+        logger.warning("Database health probe failed: %s", e)
+        health['database'] = 'down'
+        health['overall'] = 'degraded'
+    
+    # Check Sync Service connectivity. HEAD skips the response body, and the
+    # short timeout keeps an unreachable service from stalling the monitor.
+    try:
+        response = _sync_client.head("/health", timeout=HEALTH_PROBE_TIMEOUT)
+        if response.status_code < 400:
+            health['sync_service'] = 'up'
+        else:
+            health['sync_service'] = 'down'
+            health['overall'] = 'degraded'
+    except Exception as e:
+        logger.warning("Sync Service health probe failed: %s", e)
+        health['sync_service'] = 'down'
+        health['overall'] = 'degraded'
+    
+    return health
+
+
+def refresh_health():
+    """Probe the system components and store the result for the dashboard."""
+    # Drop a connection that has outlived CONN_MAX_AGE or errored
+    close_old_connections()
+    cache.set(HEALTH_CACHE_KEY, probe_health(), HEALTH_CACHE_TIMEOUT)
+
+
+def _run_health_monitor():
+    """Refresh the cached health status every HEALTH_REFRESH_INTERVAL seconds."""
+    while True:
+        try:
+            refresh_health()
+        except Exception:
+            logger.exception("Health refresh failed")
+        time.sleep(HEALTH_REFRESH_INTERVAL)
+
+
+def start_health_monitor():
+    """
+    Start the background health monitor thread for this process.
+    
+    Safe to call more than once; only the first call starts a thread.
+    The thread is a daemon, so it never keeps the process alive.
+    """
+    global _monitor_thread
+    with _monitor_lock:
+        if _monitor_thread is None:
+            _monitor_thread = threading.Thread(
+                target=_run_health_monitor, name='health-monitor', daemon=True
+            )
+            _monitor_thread.start()
@@ -74,12 +74,31 @@ class SyncJobModelTest(TestCase):
         expected = f"SyncJob {job.job_id} - running"
         self.assertEqual(str(job), expected)
     
+    def test_with_recent_logs(self):
+        """Test that with_recent_logs prefetches the newest logs of each job."""
+        jobs = SyncJob.objects.bulk_create([
+            SyncJob(user_id='test_user', status='completed') for _ in range(2)
+        ])
+        for job in jobs:
+            SyncLog.bulk_log(job.job_id, [
+                {'level': 'INFO', 'message': f'Message {i}'} for i in range(7)
+            ])
+        
+        with self.assertNumQueries(2):
+            fetched = list(SyncJob.objects.filter(user_id='test_user').with_recent_logs())
+            
+            for job in fetched:
+                self.assertEqual(
+                    [log.message for log in job.recent_logs],
+                    [f'Message {i}' for i in range(6, 1, -1)]
+                )
+    
     def test_sync_job_ordering(self):
         """Test that sync jobs are ordered by created_at descending."""
         # Create jobs with different timestamps
-        job1 = SyncJob.objects.create(user_id='user1', status='queued')
-        job2 = SyncJob.objects.create(user_id='user2', status='queued')
-        job3 = SyncJob.objects.create(user_id='user3', status='queued')
+        job1, job2, job3 = SyncJob.objects.bulk_create([
+            SyncJob(user_id=f'user{i}', status='queued') for i in range(1, 4)
+        ])
         
         jobs = list(SyncJob.objects.all())
         
@@ -146,24 +165,15 @@ class SyncStateModelTest(TestCase):
         """Test querying sync states by user_id."""
         keep_modified_at = timezone.now()
         
-        SyncState.objects.create(
-            user_id='user1',
-            keep_note_id='keep_1',
-            notion_page_id='notion_1',
-            keep_modified_at=keep_modified_at
-        )
-        SyncState.objects.create(
-            user_id='user1',
-            keep_note_id='keep_2',
-            notion_page_id='notion_2',
-            keep_modified_at=keep_modified_at
-        )
-        SyncState.objects.create(
-            user_id='user2',
-            keep_note_id='keep_3',
-            notion_page_id='notion_3',
-            keep_modified_at=keep_modified_at
-        )
+        SyncState.objects.bulk_create([
+            SyncState(
+                user_id=user_id,
+                keep_note_id=f'keep_{i}',
+                notion_page_id=f'notion_{i}',
+                keep_modified_at=keep_modified_at
+            )
+            for i, user_id in enumerate(['user1', 'user1', 'user2'], start=1)
+        ])
         
         user1_states = SyncState.objects.filter(user_id='user1')
         self.assertEqual(user1_states.count(), 2)
@@ -242,9 +252,14 @@ class CredentialModelTest(TestCase):
 class SyncLogModelTest(TestCase):
     """Test cases for SyncLog model."""
     
+    @classmethod
+    def setUpTestData(cls):
+        cls.job = SyncJob.objects.create(user_id='test_user', status='running')
+        cls.other_job = SyncJob.objects.create(user_id='test_user', status='running')
+    
     def test_create_sync_log(self):
         """Test creating a sync log entry."""
-        job_id = uuid.uuid4()
+        job_id = self.job.job_id
         
         log = SyncLog.objects.create(
             job_id=job_id,
@@ -261,7 +276,7 @@ class SyncLogModelTest(TestCase):
     
     def test_sync_log_with_note_id(self):
         """Test creating a sync log with keep_note_id."""
-        job_id = uuid.uuid4()
+        job_id = self.job.job_id
         
         log = SyncLog.objects.create(
             job_id=job_id,
@@ -275,7 +290,7 @@ class SyncLogModelTest(TestCase):
     
     def test_sync_log_level_choices(self):
         """Test that all log level choices are valid."""
-        job_id = uuid.uuid4()
+        job_id = self.job.job_id
         valid_levels = ['INFO', 'WARNING', 'ERROR']
         
         for level in valid_levels:
@@ -288,7 +303,7 @@ class SyncLogModelTest(TestCase):
     
     def test_sync_log_str_representation(self):
         """Test string representation of SyncLog."""
-        job_id = uuid.uuid4()
+        job_id = self.job.job_id
         
         log = SyncLog.objects.create(
             job_id=job_id,
@@ -301,11 +316,13 @@ class SyncLogModelTest(TestCase):
     
     def test_sync_log_ordering(self):
         """Test that sync logs are ordered by created_at descending."""
-        job_id = uuid.uuid4()
+        job_id = self.job.job_id
         
-        log1 = SyncLog.objects.create(job_id=job_id, level='INFO', message='First')
-        log2 = SyncLog.objects.create(job_id=job_id, level='INFO', message='Second')
-        log3 = SyncLog.objects.create(job_id=job_id, level='INFO', message='Third')
+        log1, log2, log3 = SyncLog.bulk_log(job_id, [
+            {'level': 'INFO', 'message': 'First'},
+            {'level': 'INFO', 'message': 'Second'},
+            {'level': 'INFO', 'message': 'Third'},
+        ])
         
         logs = list(SyncLog.objects.all())
         
@@ -316,8 +333,8 @@ class SyncLogModelTest(TestCase):
     
     def test_sync_log_query_by_job_id(self):
         """Test querying sync logs by job_id."""
-        job_id_1 = uuid.uuid4()
-        job_id_2 = uuid.uuid4()
+        job_id_1 = self.job.job_id
+        job_id_2 = self.other_job.job_id
         
         SyncLog.objects.create(job_id=job_id_1, level='INFO', message='Job 1 log 1')
         SyncLog.objects.create(job_id=job_id_1, level='INFO', message='Job 1 log 2')
@@ -328,3 +345,214 @@ class SyncLogModelTest(TestCase):
         
         job2_logs = SyncLog.objects.filter(job_id=job_id_2)
         self.assertEqual(job2_logs.count(), 1)
+    
+    def test_sync_log_bulk_log(self):
+        """Test inserting several log entries for a job at once."""
+        job_id = self.job.job_id
+        
+        SyncLog.bulk_log(job_id, [
+            {'level': 'INFO', 'message': 'Starting sync'},
+            {'level': 'WARNING', 'message': 'Note skipped', 'keep_note_id': 'keep_1'},
+            {'level': 'ERROR', 'message': 'Note failed', 'keep_note_id': 'keep_2'},
+        ])
+        
+        logs = SyncLog.objects.filter(job_id=job_id)
+        self.assertEqual(logs.count(), 3)
+        self.assertEqual(
+            set(logs.values_list('level', 'keep_note_id')),
+            {('INFO', None), ('WARNING', 'keep_1'), ('ERROR', 'keep_2')},
+        )
+    
+    def test_stream_for_job(self):
+        """Test that stream_for_job yields only the job's logs, oldest first."""
+        SyncLog.bulk_log(self.job.job_id, [
+            {'level': 'INFO', 'message': f'Message {i}'} for i in range(5)
+        ])
+        SyncLog.objects.create(job_id=self.other_job.job_id, level='INFO', message='Other')
+        
+        logs = SyncLog.objects.stream_for_job(self.job.job_id, chunk_size=2)
+        
+        self.assertEqual([log.message for log in logs], [f'Message {i}' for i in range(5)])
+    
+    def test_sync_log_deleted_with_job(self):
+        """Test that deleting a sync job removes its logs."""
+        job = SyncJob.objects.create(user_id='test_user', status='failed')
+        log = SyncLog.objects.create(job=job, level='ERROR', message='Failed')
+        
+        self.assertEqual(log.job, job)
+        
+        job.delete()
+        
+        self.assertFalse(SyncLog.objects.filter(job_id=job.job_id).exists())
+
+
+class SyncJobAdminTest(TestCase):
+    """Test cases for SyncJob admin configuration."""
+    
+    def test_active_filter_excludes_finished_jobs(self):
+        """Test that the active filter keeps only queued and running jobs."""
+        from django.contrib import admin
+        from django.test import RequestFactory
+        from .admin import ActiveJobFilter
+        
+        SyncJob.objects.bulk_create([
+            SyncJob(user_id='user1', status=status)
+            for status in ['queued', 'running', 'completed', 'failed']
+        ])
+        model_admin = admin.site._registry[SyncJob]
+        request = RequestFactory().get('/admin/sync_admin/syncjob/')
+        
+        job_filter = ActiveJobFilter(request, {'active': 'yes'}, SyncJob, model_admin)
+        jobs = job_filter.queryset(request, SyncJob.objects.all())
+        
+        self.assertEqual(
+            sorted(jobs.values_list('status', flat=True)),
+            ['queued', 'running']
+        )
+
+
+class SyncJobExportTest(TestCase):
+    """Test cases for the SyncJob log export action."""
+    
+    def test_export_logs_streams_csv(self):
+        """Test that the export action streams a CSV of the selected jobs' logs."""
+        from django.contrib import admin
+        from django.test import RequestFactory
+        
+        job = SyncJob.objects.create(user_id='test_user', status='completed')
+        SyncLog.bulk_log(job.job_id, [
+            {'level': 'INFO', 'message': 'Started'},
+            {'level': 'ERROR', 'message': 'Failed, retrying', 'keep_note_id': 'note_1'},
+        ])
+        model_admin = admin.site._registry[SyncJob]
+        request = RequestFactory().post('/admin/sync_admin/syncjob/')
+        
+        response = model_admin.export_logs(request, SyncJob.objects.filter(pk=job.pk))
+        
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertEqual(lines[0], 'job_id,created_at,level,keep_note_id,message')
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[2].endswith(',ERROR,note_1,"Failed, retrying"'))
+
+
+class SyncLogAdminTest(TestCase):
+    """Test cases for SyncLog admin configuration."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.job = SyncJob.objects.create(user_id='test_user', status='running')
+    
+    def setUp(self):
+        from django.contrib import admin
+        from django.test import RequestFactory
+        
+        self.model_admin = admin.site._registry[SyncLog]
+        self.request = RequestFactory().get('/admin/sync_admin/synclog/')
+    
+    def test_message_preview_truncates_long_messages(self):
+        """Test that long messages are truncated to 100 characters."""
+        SyncLog.objects.create(job=self.job, level='ERROR', message='x' * 500)
+        
+        log = self.model_admin.get_queryset(self.request).get()
+        
+        self.assertEqual(self.model_admin.message_preview(log), 'x' * 100 + '...')
+    
+    def test_message_preview_keeps_short_messages(self):
+        """Test that short messages are shown in full."""
+        SyncLog.objects.create(job=self.job, level='INFO', message='Short message')
+        
+        log = self.model_admin.get_queryset(self.request).get()
+        
+        self.assertEqual(self.model_admin.message_preview(log), 'Short message')
+
+    def test_message_preview_exact_length_has_no_ellipsis(self):
+        """Test that a message of exactly 100 characters is not marked as truncated."""
+        SyncLog.objects.create(job=self.job, level='INFO', message='y' * 100)
+
+        log = self.model_admin.get_queryset(self.request).get()
+
+        self.assertEqual(self.model_admin.message_preview(log), 'y' * 100)
+    
+    def test_message_preview_one_past_limit_is_truncated(self):
+        """Test that a 101-character message, the longest prefix read, is truncated."""
+        SyncLog.objects.create(job=self.job, level='INFO', message='z' * 101)
+        
+        log = self.model_admin.get_queryset(self.request).get()
+        
+        self.assertEqual(self.model_admin.message_preview(log), 'z' * 100 + '...')
+
+
+class CredentialAdminTest(TestCase):
+    """Test cases for Credential admin configuration."""
+    
+    def test_token_fields_use_wide_widget(self):
+        """Test that both token fields render with the widened textarea."""
+        from django.contrib import admin
+        from django.test import RequestFactory
+        
+        model_admin = admin.site._registry[Credential]
+        request = RequestFactory().get('/admin/sync_admin/credential/add/')
+        form = model_admin.get_form(request)
+        
+        for name in ('google_oauth_token', 'notion_api_token'):
+            self.assertEqual(form.base_fields[name].widget.attrs['style'], 'width: 600px;')
+
+
+class CursorChangeListTest(TestCase):
+    """Test cases for keyset pagination on the admin changelists."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        from django.contrib.auth.models import User
+        
+        cls.user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        cls.job = SyncJob.objects.create(user_id='test_user', status='running')
+        cls.logs = SyncLog.bulk_log(cls.job.job_id, [
+            {'level': 'INFO', 'message': f'Message {i}'} for i in range(101)
+        ])
+    
+    def setUp(self):
+        self.client.force_login(self.user)
+    
+    def test_next_page_continues_after_last_row(self):
+        """Test that the next-page link returns the rows after the first page."""
+        response = self.client.get('/admin/sync_admin/synclog/')
+        
+        cl = response.context['cl']
+        self.assertEqual(len(cl.result_list), 100)
+        self.assertIsNotNone(cl.next_cursor_url)
+        self.assertContains(response, 'Next page')
+        
+        response = self.client.get('/admin/sync_admin/synclog/' + cl.next_cursor_url)
+        
+        cl = response.context['cl']
+        self.assertEqual([log.message for log in cl.result_list], ['Message 0'])
+        self.assertIsNone(cl.next_cursor_url)
+    
+    def test_cursor_page_does_not_count_rows(self):
+        """Test that a keyset page runs no COUNT query."""
+        response = self.client.get('/admin/sync_admin/synclog/')
+        next_url = '/admin/sync_admin/synclog/' + response.context['cl'].next_cursor_url
+        
+        # Session, user, and the page of rows
+        with self.assertNumQueries(3):
+            response = self.client.get(next_url)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.context['cl'].full_result_count)
+    
+    def test_sorting_falls_back_to_numbered_pages(self):
+        """Test that sorting by another column uses the regular paginator."""
+        response = self.client.get('/admin/sync_admin/synclog/', {'o': '3'})
+        
+        cl = response.context['cl']
+        self.assertFalse(cl.is_keyset)
+        self.assertEqual(len(cl.result_list), 100)
+    
+    def test_invalid_cursor_is_rejected(self):
+        """Test that a malformed cursor redirects with the admin error flag."""
+        response = self.client.get('/admin/sync_admin/synclog/', {'cursor': 'bogus'})
+        
+        self.assertEqual(response.status_code, 302)
+        self.assertIn('e=1', response.url)
@@ -1,20 +1,105 @@
 """Views for the sync_admin app."""
 
 from django.shortcuts import render, get_object_or_404, redirect
+from django.core.cache import cache
 from django.core.paginator import Paginator
+from django.http import Http404, StreamingHttpResponse
 from django.db.models import Count, Q
 from django.utils import timezone
+from django.utils.html import format_html
 from django.contrib import messages
-from datetime import timedelta, datetime
+from django.core.handlers.asgi import ASGIRequest
+from datetime import timedelta, datetime, time
+from uuid import UUID
+import asyncio
+import functools
+from contextlib import asynccontextmanager
 import httpx
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from .constants import HEALTH_CACHE_KEY
+from .forms import JobListFilterForm
 from .models import SyncJob, SyncState, Credential, SyncLog
-import sys
-import os
+from .pagination import paginate
 
-# Add shared directory to path to import encryption utilities
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../shared'))
-from encryption import EncryptionService
+
+@functools.lru_cache(maxsize=1)
+def _get_encryption_service():
+    """Return the process-wide EncryptionService, creating it on first use."""
+    # Imported here so workers that never handle credentials skip loading
+    # the crypto libraries; settings puts shared/ on sys.path
+    from encryption import EncryptionService
+    
+    return EncryptionService()
+
+
+_async_client = None
+_async_client_loop = None
+
+
+def _get_async_client():
+    """
+    Return the pooled async client for calls to the Sync Service.
+    
+    Its connections belong to the event loop that opened them, so the client
+    is rebuilt whenever the running loop changes; the previous client is
+    closed on its own loop if that loop is still running. Under ASGI there is
+    a single loop and the pool is shared by every request of the worker.
+    """
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        if _async_client is not None and not _async_client_loop.is_closed():
+            asyncio.run_coroutine_threadsafe(_async_client.aclose(), _async_client_loop)
+        _async_client = httpx.AsyncClient(
+            base_url=settings.SYNC_SERVICE_URL,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+        _async_client_loop = loop
+    return _async_client
+
+
+@asynccontextmanager
+async def _sync_service_client(request):
+    """
+    Yield an async client for calls to the Sync Service.
+    
+    Under ASGI this is the worker's pooled client. Under WSGI (and runserver)
+    each async view runs on a new event loop that is discarded afterwards, so
+    a pooled client would leak its connections; the request gets its own
+    client, closed when the block exits.
+    """
+    if isinstance(request, ASGIRequest):
+        yield _get_async_client()
+        return
+    async with httpx.AsyncClient(
+        base_url=settings.SYNC_SERVICE_URL, timeout=10.0
+    ) as client:
+        yield client
+
+
+async def _aget_object_or_404(model, **kwargs):
+    """Async counterpart of get_object_or_404."""
+    try:
+        return await model.objects.aget(**kwargs)
+    except model.DoesNotExist:
+        raise Http404(f'No {model._meta.object_name} matches the given query.')
+
+
+async def _arender(request, template_name, context):
+    """Render a template from an async view (context processors may read the session)."""
+    return await sync_to_async(render)(request, template_name, context)
+
+
+DASHBOARD_CACHE_KEY = 'dashboard:payload:v2'
+DASHBOARD_CACHE_TIMEOUT = 30  # seconds
+
+MAX_USER_CHOICES = 500
+LOG_TAIL_SIZE = 500
+BULK_SYNC_BATCH_SIZE = 500
+# Batches sent to the Sync Service at once by "Sync All Users"
+BULK_SYNC_MAX_IN_FLIGHT = 2
 
 
 def dashboard(request):
@@ -23,21 +108,43 @@ def dashboard(request):
     
     Requirements: 6.1 - Display dashboard showing recent sync jobs and their status
     """
-    # Get recent sync jobs (last 20)
-    recent_jobs = SyncJob.objects.all()[:20]
+    # Get recent sync jobs (last 20); error_message is not shown here
+    recent_jobs = SyncJob.objects.defer('error_message')[:20]
+    
+    # Statistics are cached briefly; job changes made through this
+    # interface invalidate them
+    stats = cache.get_or_set(
+        DASHBOARD_CACHE_KEY, _compute_dashboard_stats, DASHBOARD_CACHE_TIMEOUT
+    )
+    
+    context = {
+        'recent_jobs': recent_jobs,
+        'stats': stats,
+        'health_status': check_system_health(),
+    }
     
+    return render(request, 'dashboard.html', context)
+
+
+def _compute_dashboard_stats():
+    """
+    Compute the dashboard statistics.
+    
+    Returns:
+        dict: Job, note and user counts for the dashboard template
+    """
     # Calculate statistics for the last 24 hours
     last_24h = timezone.now() - timedelta(hours=24)
     
-    # Success/failure statistics
-    stats = {
-        'total_jobs': SyncJob.objects.count(),
-        'jobs_last_24h': SyncJob.objects.filter(created_at__gte=last_24h).count(),
-        'successful_jobs': SyncJob.objects.filter(status='completed').count(),
-        'failed_jobs': SyncJob.objects.filter(status='failed').count(),
-        'running_jobs': SyncJob.objects.filter(status='running').count(),
-        'queued_jobs': SyncJob.objects.filter(status='queued').count(),
-    }
+    # Success/failure statistics (one aggregate query over sync_jobs)
+    stats = SyncJob.objects.aggregate(
+        total_jobs=Count('pk'),
+        jobs_last_24h=Count('pk', filter=Q(created_at__gte=last_24h)),
+        successful_jobs=Count('pk', filter=Q(status='completed')),
+        failed_jobs=Count('pk', filter=Q(status='failed')),
+        running_jobs=Count('pk', filter=Q(status='running')),
+        queued_jobs=Count('pk', filter=Q(status='queued')),
+    )
     
     # Calculate success rate
     if stats['total_jobs'] > 0:
@@ -53,56 +160,30 @@ def dashboard(request):
     # Get unique users
     stats['total_users'] = Credential.objects.count()
     
-    # Check system health
-    health_status = check_system_health()
-    
-    context = {
-        'recent_jobs': recent_jobs,
-        'stats': stats,
-        'health_status': health_status,
-    }
-    
-    return render(request, 'dashboard.html', context)
+    return stats
 
 
 def check_system_health():
     """
-    Check the health of various system components.
+    Return the latest system health status.
+    
+    The status is probed off the request path by the health monitor in
+    sync_admin.tasks; until its first run every component is 'unknown'.
     
     Returns:
         dict: Health status of each component
     """
-    health = {
-        'database': 'up',
+    return cache.get(HEALTH_CACHE_KEY, {
+        'database': 'unknown',
         'sync_service': 'unknown',
-        'overall': 'healthy',
-    }
-    
-    # Check database connectivity
-    try:
-        SyncJob.objects.count()
-        health['database'] = 'up'
-    except Exception as e:
-        health['database'] = 'down'
-        health['overall'] = 'degraded'
-    
-    # Check Sync Service connectivity
-    try:
-        sync_service_url = settings.SYNC_SERVICE_URL
-        with httpx.Client(timeout=5.0) as client:
-            response = client.get(f"{sync_service_url}/health")
-            if response.status_code == 200:
-                health['sync_service'] = 'up'
-            else:
-                health['sync_service'] = 'down'
-                health['overall'] = 'degraded'
-    except Exception as e:
-        health['sync_service'] = 'down'
-        health['overall'] = 'degraded'
-    
-    return health
+        'overall': 'unknown',
+    })
 
 
+def _start_of_day(day):
+    """Return midnight at the start of ``day`` in the current time zone."""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
 
 def sync_job_list(request):
     """
@@ -110,60 +191,63 @@ def sync_job_list(request):
     
     Requirements: 6.1, 6.5 - Display paginated list of sync jobs with filters
     """
-    # Get filter parameters from request
-    status_filter = request.GET.get('status', '')
-    user_filter = request.GET.get('user', '')
-    date_from = request.GET.get('date_from', '')
-    date_to = request.GET.get('date_to', '')
+    # Get filter parameters from request. Fields that fail validation are
+    # left out of cleaned_data, so an invalid filter is simply not applied.
+    filter_form = JobListFilterForm(request.GET)
+    filter_form.is_valid()
+    filters = filter_form.cleaned_data
     
-    # Start with all sync jobs
-    jobs = SyncJob.objects.all()
+    # Start with all sync jobs, skipping the error_message TEXT column, which
+    # the list does not render
+    jobs = SyncJob.objects.defer('error_message')
     
     # Apply filters
-    if status_filter:
-        jobs = jobs.filter(status=status_filter)
-    
-    if user_filter:
-        jobs = jobs.filter(user_id__icontains=user_filter)
-    
-    if date_from:
-        try:
-            date_from_obj = datetime.strptime(date_from, '%Y-%m-%d')
-            jobs = jobs.filter(created_at__gte=date_from_obj)
-        except ValueError:
-            pass
+    if filters.get('status'):
+        jobs = jobs.filter(status=filters['status'])
+    
+    if filters.get('user'):
+        # Substring match; on Postgres idx_sync_jobs_user_id_trgm (a trigram
+        # GIN index on UPPER(user_id)) serves this icontains filter
+        jobs = jobs.filter(user_id__icontains=filters['user'])
+    
+    # Dates select the half-open interval [date_from, date_to + 1 day), a
+    # plain range scan on the created_at index
+    if filters.get('date_from'):
+        jobs = jobs.filter(created_at__gte=_start_of_day(filters['date_from']))
+    
+    if filters.get('date_to'):
+        jobs = jobs.filter(
+            created_at__lt=_start_of_day(filters['date_to'] + timedelta(days=1))
+        )
     
-    if date_to:
-        try:
-            date_to_obj = datetime.strptime(date_to, '%Y-%m-%d')
-            # Add one day to include the entire end date
-            date_to_obj = date_to_obj.replace(hour=23, minute=59, second=59)
-            jobs = jobs.filter(created_at__lte=date_to_obj)
-        except ValueError:
-            pass
-    
-    # Paginate results (50 per page as per requirement 6.5)
-    paginator = Paginator(jobs, 50)
-    page_number = request.GET.get('page', 1)
-    page_obj = paginator.get_page(page_number)
+    # Paginate results (50 per page as per requirement 6.5). Keyset pagination
+    # seeks from the cursor, so no COUNT(*) over the filtered jobs is needed.
+    try:
+        page_obj = paginate(
+            jobs, 50,
+            after=request.GET.get('cursor'),
+            before=request.GET.get('before'),
+        )
+    except ValueError:
+        page_obj = paginate(jobs, 50)
     
     # Get available status choices for filter dropdown
     status_choices = SyncJob.STATUS_CHOICES
     
-    # Get unique users for filter dropdown (limit to 100 for performance)
-    unique_users = SyncJob.objects.values_list('user_id', flat=True).distinct()[:100]
+    # Get users for filter dropdown (limit to 100 for performance). Read from
+    # credentials, which has one row per user, rather than DISTINCT over jobs.
+    unique_users = Credential.objects.order_by('user_id').values_list('user_id', flat=True)[:100]
     
     context = {
         'page_obj': page_obj,
         'status_choices': status_choices,
         'unique_users': unique_users,
         'current_filters': {
-            'status': status_filter,
-            'user': user_filter,
-            'date_from': date_from,
-            'date_to': date_to,
+            'status': request.GET.get('status', ''),
+            'user': request.GET.get('user', ''),
+            'date_from': request.GET.get('date_from', ''),
+            'date_to': request.GET.get('date_to', ''),
         },
-        'total_count': paginator.count,
     }
     
     return render(request, 'sync_job_list.html', context)
@@ -208,7 +292,37 @@ def sync_job_detail(request, job_id):
     return render(request, 'sync_job_detail.html', context)
 
 
-def retry_sync_job(request, job_id):
+async def sync_job_log_tail(request, job_id):
+    """
+    Stream the newest LOG_TAIL_SIZE log entries of a sync job as an HTML table.
+    
+    Rows are written as they are fetched, so memory use does not grow with
+    the size of the job's log history.
+    
+    Requirements: 6.3 - Display detailed logs for each sync job
+    """
+    if not await SyncJob.objects.filter(job_id=job_id).aexists():
+        raise Http404('No SyncJob matches the given query.')
+    
+    logs = (
+        SyncLog.objects.filter(job_id=job_id)
+        .order_by('-created_at', '-id')
+        .only('level', 'message', 'created_at')[:LOG_TAIL_SIZE]
+    )
+    
+    async def rows():
+        yield '<table>\n'
+        async for log in logs.aiterator(chunk_size=200):
+            yield format_html(
+                '<tr><td>{}</td><td>{}</td><td>{}</td></tr>\n',
+                log.created_at.strftime('%Y-%m-%d %H:%M:%S'), log.level, log.message,
+            )
+        yield '</table>\n'
+    
+    return StreamingHttpResponse(rows(), content_type='text/html; charset=utf-8')
+
+
+async def retry_sync_job(request, job_id):
     """
     Retry a failed sync job.
     
@@ -219,7 +333,7 @@ def retry_sync_job(request, job_id):
         return redirect('sync_job_detail', job_id=job_id)
     
     # Get the sync job
-    job = get_object_or_404(SyncJob, job_id=job_id)
+    job = await _aget_object_or_404(SyncJob, job_id=job_id)
     
     # Check if job is in a failed state
     if job.status != 'failed':
@@ -227,39 +341,37 @@ def retry_sync_job(request, job_id):
         return redirect('sync_job_detail', job_id=job_id)
     
     try:
-        # Get user credentials
-        try:
-            credential = Credential.objects.get(user_id=job.user_id)
-        except Credential.DoesNotExist:
+        # Verify user has credentials (SELECT 1 ... LIMIT 1; the encrypted
+        # tokens are not needed here)
+        if not await Credential.objects.filter(user_id=job.user_id).aexists():
             messages.error(request, f'No credentials found for user {job.user_id}')
             return redirect('sync_job_detail', job_id=job_id)
         
         # Call Sync Service to retry the job
-        sync_service_url = settings.SYNC_SERVICE_URL
-        
-        with httpx.Client(timeout=10.0) as client:
-            response = client.post(
-                f"{sync_service_url}/internal/sync/execute",
+        async with _sync_service_client(request) as client:
+            response = await client.post(
+                "/internal/sync/execute",
                 json={
                     "user_id": job.user_id,
                     "full_sync": job.full_sync,
                 }
             )
-            
-            if response.status_code == 200:
-                result = response.json()
-                new_job_id = result.get('job_id')
-                messages.success(
-                    request, 
-                    f'Sync job retry initiated successfully. New job ID: {new_job_id}'
-                )
-                # Redirect to the new job
-                return redirect('sync_job_detail', job_id=new_job_id)
-            else:
-                messages.error(
-                    request, 
-                    f'Failed to retry sync job. Status: {response.status_code}, Error: {response.text}'
-                )
+        
+        if response.status_code == 200:
+            result = response.json()
+            new_job_id = result.get('job_id')
+            await cache.adelete(DASHBOARD_CACHE_KEY)
+            messages.success(
+                request, 
+                f'Sync job retry initiated successfully. New job ID: {new_job_id}'
+            )
+            # Redirect to the new job
+            return redirect('sync_job_detail', job_id=new_job_id)
+        else:
+            messages.error(
+                request, 
+                f'Failed to retry sync job. Status: {response.status_code}, Error: {response.text}'
+            )
     
     except httpx.RequestError as e:
         messages.error(request, f'Failed to connect to Sync Service: {str(e)}')
@@ -269,7 +381,75 @@ def retry_sync_job(request, job_id):
     return redirect('sync_job_detail', job_id=job_id)
 
 
-def abort_sync_job(request, job_id):
+async def bulk_retry_sync_jobs(request):
+    """
+    Retry several failed sync jobs with a single Sync Service call.
+    
+    Selected jobs are grouped by user, so each user gets one new sync job;
+    it is a full sync if any of that user's selected jobs was.
+    
+    Requirements: 6.3 - Allow retry of failed jobs
+    """
+    if request.method != 'POST':
+        messages.error(request, 'Invalid request method.')
+        return redirect('sync_job_list')
+    
+    try:
+        job_ids = [UUID(job_id) for job_id in request.POST.getlist('job_ids')]
+    except ValueError:
+        messages.error(request, 'Invalid job ID.')
+        return redirect('sync_job_list')
+    
+    # One query for the selected failed jobs, one for their credentials
+    full_sync_by_user = {}
+    failed_jobs = SyncJob.objects.filter(job_id__in=job_ids, status='failed')
+    async for user_id, full_sync in failed_jobs.values_list('user_id', 'full_sync'):
+        full_sync_by_user[user_id] = full_sync_by_user.get(user_id, False) or full_sync
+    
+    users_with_credentials = {
+        user_id async for user_id in
+        Credential.objects.filter(user_id__in=full_sync_by_user)
+        .values_list('user_id', flat=True)
+    }
+    for user_id in sorted(full_sync_by_user.keys() - users_with_credentials):
+        messages.error(request, f'No credentials found for user {user_id}')
+        del full_sync_by_user[user_id]
+    
+    if not full_sync_by_user:
+        messages.warning(request, 'No failed jobs to retry were selected.')
+        return redirect('sync_job_list')
+    
+    try:
+        async with _sync_service_client(request) as client:
+            response = await client.post(
+                "/internal/sync/execute_bulk",
+                json=[
+                    {"user_id": user_id, "full_sync": full_sync}
+                    for user_id, full_sync in sorted(full_sync_by_user.items())
+                ]
+            )
+        
+        if response.status_code == 200:
+            await cache.adelete(DASHBOARD_CACHE_KEY)
+            messages.success(
+                request,
+                f'Sync job retry initiated for {len(response.json())} user(s).'
+            )
+        else:
+            messages.error(
+                request,
+                f'Failed to retry sync jobs. Status: {response.status_code}, Error: {response.text}'
+            )
+    
+    except httpx.RequestError as e:
+        messages.error(request, f'Failed to connect to Sync Service: {str(e)}')
+    except Exception as e:
+        messages.error(request, f'Unexpected error: {str(e)}')
+    
+    return redirect('sync_job_list')
+
+
+async def abort_sync_job(request, job_id):
     """
     Abort a running or queued sync job.
     
@@ -280,7 +460,7 @@ def abort_sync_job(request, job_id):
         return redirect('sync_job_detail', job_id=job_id)
     
     # Get the sync job
-    job = get_object_or_404(SyncJob, job_id=job_id)
+    job = await _aget_object_or_404(SyncJob, job_id=job_id)
     
     # Check if job can be aborted
     if job.status not in ['running', 'queued']:
@@ -289,24 +469,21 @@ def abort_sync_job(request, job_id):
     
     try:
         # Call Sync Service to abort the job
-        sync_service_url = settings.SYNC_SERVICE_URL
+        async with _sync_service_client(request) as client:
+            response = await client.post(f"/internal/sync/abort/{job_id}")
         
-        with httpx.Client(timeout=10.0) as client:
-            response = client.post(
-                f"{sync_service_url}/internal/sync/abort/{job_id}"
+        if response.status_code == 200:
+            result = response.json()
+            await cache.adelete(DASHBOARD_CACHE_KEY)
+            messages.success(
+                request, 
+                f'Sync job {job_id} has been aborted successfully.'
+            )
+        else:
+            messages.error(
+                request, 
+                f'Failed to abort sync job. Status: {response.status_code}, Error: {response.text}'
             )
-            
-            if response.status_code == 200:
-                result = response.json()
-                messages.success(
-                    request, 
-                    f'Sync job {job_id} has been aborted successfully.'
-                )
-            else:
-                messages.error(
-                    request, 
-                    f'Failed to abort sync job. Status: {response.status_code}, Error: {response.text}'
-                )
     
     except httpx.RequestError as e:
         messages.error(request, f'Failed to connect to Sync Service: {str(e)}')
@@ -316,14 +493,28 @@ def abort_sync_job(request, job_id):
     return redirect('sync_job_detail', job_id=job_id)
 
 
-def manual_sync_trigger(request):
+async def manual_sync_trigger(request):
     """
     Manual sync trigger form view.
     
     Requirements: 6.2 - Provide form to manually trigger sync jobs
     """
-    # Get all users with credentials for the dropdown
-    users = Credential.objects.all().values_list('user_id', flat=True)
+    # Users with credentials for the dropdown, capped so the page stays
+    # small; past the cap the template falls back to a text input
+    users = [
+        user_id async for user_id in
+        Credential.objects.order_by('user_id')
+        .values_list('user_id', flat=True)[:MAX_USER_CHOICES + 1]
+    ]
+    users_truncated = len(users) > MAX_USER_CHOICES
+    users = users[:MAX_USER_CHOICES]
+    # Shown by "Sync All Users"; only counted when the list was capped
+    user_count = await Credential.objects.acount() if users_truncated else len(users)
+    context = {
+        'users': users,
+        'users_truncated': users_truncated,
+        'user_count': user_count,
+    }
     
     if request.method == 'POST':
         # Get form data
@@ -333,59 +524,125 @@ def manual_sync_trigger(request):
         # Validate inputs
         if not user_id:
             messages.error(request, 'Please select a user.')
-            return render(request, 'manual_sync_trigger.html', {'users': users})
+            return await _arender(request, 'manual_sync_trigger.html', context)
         
         if not sync_type:
             messages.error(request, 'Please select a sync type.')
-            return render(request, 'manual_sync_trigger.html', {'users': users})
+            return await _arender(request, 'manual_sync_trigger.html', context)
         
         # Determine if it's a full sync
         full_sync = (sync_type == 'full')
         
         try:
             # Verify user has credentials
-            try:
-                credential = Credential.objects.get(user_id=user_id)
-            except Credential.DoesNotExist:
+            if not await Credential.objects.filter(user_id=user_id).aexists():
                 messages.error(request, f'No credentials found for user {user_id}')
-                return render(request, 'manual_sync_trigger.html', {'users': users})
+                return await _arender(request, 'manual_sync_trigger.html', context)
             
             # Call Sync Service to initiate sync
-            sync_service_url = settings.SYNC_SERVICE_URL
-            
-            with httpx.Client(timeout=10.0) as client:
-                response = client.post(
-                    f"{sync_service_url}/internal/sync/execute",
+            async with _sync_service_client(request) as client:
+                response = await client.post(
+                    "/internal/sync/execute",
                     json={
                         "user_id": user_id,
                         "full_sync": full_sync,
                     }
                 )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    job_id = result.get('job_id')
-                    messages.success(
-                        request,
-                        f'Sync job initiated successfully! Job ID: {job_id}'
-                    )
-                    # Redirect to the job detail page
-                    return redirect('sync_job_detail', job_id=job_id)
-                else:
-                    messages.error(
-                        request,
-                        f'Failed to initiate sync job. Status: {response.status_code}, Error: {response.text}'
-                    )
+            
+            if response.status_code == 200:
+                result = response.json()
+                job_id = result.get('job_id')
+                await cache.adelete(DASHBOARD_CACHE_KEY)
+                messages.success(
+                    request,
+                    f'Sync job initiated successfully! Job ID: {job_id}'
+                )
+                # Redirect to the job detail page
+                return redirect('sync_job_detail', job_id=job_id)
+            else:
+                messages.error(
+                    request,
+                    f'Failed to initiate sync job. Status: {response.status_code}, Error: {response.text}'
+                )
         
         except httpx.RequestError as e:
             messages.error(request, f'Failed to connect to Sync Service: {str(e)}')
         except Exception as e:
             messages.error(request, f'Unexpected error: {str(e)}')
         
-        return render(request, 'manual_sync_trigger.html', {'users': users})
+        return await _arender(request, 'manual_sync_trigger.html', context)
     
     # GET request - display the form
-    return render(request, 'manual_sync_trigger.html', {'users': users})
+    return await _arender(request, 'manual_sync_trigger.html', context)
+
+
+async def bulk_manual_sync_trigger(request):
+    """
+    Trigger a sync job for every user with credentials.
+    
+    Users are sent to the Sync Service bulk endpoint in batches of
+    BULK_SYNC_BATCH_SIZE, with at most BULK_SYNC_MAX_IN_FLIGHT batches in
+    flight at once. The Sync Service queues every job and runs a limited
+    number of them concurrently.
+    
+    Requirements: 6.2 - Provide form to manually trigger sync jobs
+    """
+    if request.method != 'POST':
+        messages.error(request, 'Invalid request method.')
+        return redirect('manual_sync_trigger')
+    
+    sync_type = request.POST.get('sync_type')
+    if not sync_type:
+        messages.error(request, 'Please select a sync type.')
+        return redirect('manual_sync_trigger')
+    full_sync = (sync_type == 'full')
+    
+    user_ids = [
+        user_id async for user_id in
+        Credential.objects.order_by('user_id').values_list('user_id', flat=True)
+    ]
+    if not user_ids:
+        messages.warning(request, 'No users with credentials found.')
+        return redirect('manual_sync_trigger')
+    
+    batches = [
+        user_ids[i:i + BULK_SYNC_BATCH_SIZE]
+        for i in range(0, len(user_ids), BULK_SYNC_BATCH_SIZE)
+    ]
+    in_flight = asyncio.Semaphore(BULK_SYNC_MAX_IN_FLIGHT)
+    
+    async def send(client, batch):
+        async with in_flight:
+            return await client.post(
+                "/internal/sync/execute_bulk",
+                json=[{"user_id": user_id, "full_sync": full_sync} for user_id in batch]
+            )
+    
+    async with _sync_service_client(request) as client:
+        responses = await asyncio.gather(
+            *[send(client, batch) for batch in batches], return_exceptions=True
+        )
+    
+    queued = 0
+    for batch, response in zip(batches, responses):
+        if isinstance(response, httpx.RequestError):
+            messages.error(request, f'Failed to connect to Sync Service: {str(response)}')
+        elif isinstance(response, Exception):
+            messages.error(request, f'Unexpected error: {str(response)}')
+        elif response.status_code == 200:
+            queued += len(batch)
+        else:
+            messages.error(
+                request,
+                f'Failed to initiate sync jobs. Status: {response.status_code}, Error: {response.text}'
+            )
+    
+    if not queued:
+        return redirect('manual_sync_trigger')
+    
+    await cache.adelete(DASHBOARD_CACHE_KEY)
+    messages.success(request, f'Sync jobs initiated for {queued} user(s).')
+    return redirect('sync_job_list')
 
 
 def credential_config(request):
@@ -395,8 +652,7 @@ def credential_config(request):
     Requirements: 6.4 - Allow configuration of Google Keep and Notion credentials
     Requirements: 10.1 - Encrypt credentials before storing
     """
-    # Initialize encryption service
-    encryption_service = EncryptionService()
+    encryption_service = _get_encryption_service()
     
     # Get all existing credentials
     credentials = Credential.objects.all()
@@ -516,16 +772,14 @@ def clear_sync_state(request, user_id):
         return redirect('credential_config')
     
     try:
-        # Get count of records to delete
-        sync_state_count = SyncState.objects.filter(user_id=user_id).count()
+        # Delete all sync state records for this user in one statement;
+        # delete() reports how many rows it removed
+        sync_state_count, _ = SyncState.objects.filter(user_id=user_id).delete()
         
         if sync_state_count == 0:
             messages.info(request, f'No sync state records found for user {user_id}')
             return redirect('credential_config')
         
-        # Delete all sync state records for this user
-        SyncState.objects.filter(user_id=user_id).delete()
-        
         messages.success(
             request,
             f'Cleared {sync_state_count} sync state record(s) for user {user_id}. '
@@ -1,15 +1,4 @@
-"""Test script to verify Django admin registration."""
-
-import os
-import sys
-import django
-
-# Add the admin_interface directory to the path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-# Set up Django settings
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'admin_project.settings')
-django.setup()
+"""Tests for the Django admin registration of the sync_admin models."""
 
 from django.contrib import admin
 from sync_admin.models import SyncJob, SyncState, Credential, SyncLog
@@ -61,12 +50,3 @@ def test_admin_registration():
     print("All admin registration tests passed!")
     print("="*50)
 
-
-if __name__ == '__main__':
-    try:
-        test_admin_registration()
-    except Exception as e:
-        print(f"\n✗ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
@@ -9,69 +9,86 @@ Tests the credential management functionality including:
 - Form validation
 """
 
-import os
-import sys
-import django
-from django.test import TestCase, Client, override_settings
+from django.template.defaultfilters import truncatechars
+from django.test import TestCase, override_settings
 from django.urls import reverse
+from django.utils import timezone
 from unittest.mock import patch, MagicMock
-
-# Setup Django
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'admin_project.settings')
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-django.setup()
-
-from sync_admin.models import Credential
+from sync_admin.models import Credential, SyncState
 
 
 @override_settings(ALLOWED_HOSTS=['*'])
 class CredentialConfigViewTests(TestCase):
     """Test cases for credential configuration view."""
     
-    def setUp(self):
-        """Set up test client and test data."""
-        self.client = Client()
-        self.url = reverse('credential_config')
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test."""
+        cls.url = reverse('credential_config')
         
-        # Create test credentials
-        self.test_user_id = 'test_user@example.com'
-        self.test_google_token = 'test_google_oauth_token_12345'
-        self.test_notion_token = 'secret_test_notion_token_67890'
-        self.test_database_id = 'abc123def456ghi789jkl012'
+        # Test credentials; each test creates the rows it needs, and the
+        # per-test transaction rollback removes them again
+        cls.test_user_id = 'test_user@example.com'
+        cls.test_google_token = 'test_google_oauth_token_12345'
+        cls.test_notion_token = 'secret_test_notion_token_67890'
+        cls.test_database_id = 'abc123def456ghi789jkl012'
     
-    def tearDown(self):
-        """Clean up after tests."""
-        Credential.objects.all().delete()
+    # Tests that exercise the real EncryptionService; every other test gets
+    # a fake one
+    REAL_ENCRYPTION_TESTS = {'test_create_new_credential'}
     
-    def test_view_credential_config_page(self):
-        """Test that the credential configuration page loads successfully."""
-        response = self.client.get(self.url)
-        
-        # Debug: print response details if not 200
-        if response.status_code != 200:
-            print(f"Status code: {response.status_code}")
-            print(f"Content: {response.content.decode()[:500]}")
-        
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'credential_config.html')
-        self.assertContains(response, 'Credential Configuration')
-        self.assertContains(response, 'Add New Credentials')
+    def setUp(self):
+        """Set up a fake encryption service unless the test needs real crypto."""
+        # TestCase already provides self.client, a fresh Client per test
+        if self._testMethodName not in self.REAL_ENCRYPTION_TESTS:
+            patcher = patch('sync_admin.views._get_encryption_service')
+            self.mock_encryption = patcher.start()
+            self.mock_encryption.return_value.encrypt.side_effect = lambda value: f'enc:{value}'
+            self.addCleanup(patcher.stop)
     
-    def test_view_shows_existing_credentials(self):
-        """Test that existing credentials are displayed in the list."""
-        # Create test credential
+    def test_credential_page_rendering(self):
+        """Test that the page loads and lists every existing credential."""
         Credential.objects.create(
             user_id=self.test_user_id,
             google_oauth_token='encrypted_token_1',
             notion_api_token='encrypted_token_2',
             notion_database_id=self.test_database_id
         )
+        for i in range(3):
+            Credential.objects.create(
+                user_id=f'user{i}@example.com',
+                google_oauth_token=f'encrypted_google_{i}',
+                notion_api_token=f'encrypted_notion_{i}',
+                notion_database_id=f'database_id_{i}'
+            )
         
+        # One request serves all the rendering checks; the page is decoded once
         response = self.client.get(self.url)
+        content = response.content.decode('utf-8')
         
-        self.assertEqual(response.status_code, 200)
-        self.assertContains(response, self.test_user_id)
-        self.assertContains(response, self.test_database_id)
+        with self.subTest('loads'):
+            self.assertEqual(response.status_code, 200)
+            self.assertTemplateUsed(response, 'credential_config.html')
+            self.assertIn('Credential Configuration', content)
+            self.assertIn('Add New Credentials', content)
+        
+        with self.subTest('existing credential'):
+            self.assertIn(self.test_user_id, content)
+            # The list shows the database ID shortened to 20 characters
+            self.assertIn(truncatechars(self.test_database_id, 20), content)
+        
+        with self.subTest('multiple credentials'):
+            # Check the listed credentials in the context, and the rendered
+            # page once, rather than scanning the page for every value
+            database_ids = {
+                credential.user_id: credential.notion_database_id
+                for credential in response.context['credentials']
+            }
+            self.assertEqual(database_ids, {
+                self.test_user_id: self.test_database_id,
+                **{f'user{i}@example.com': f'database_id_{i}' for i in range(3)},
+            })
+            self.assertInHTML('<strong>user0@example.com</strong>', content, count=1)
     
     def test_create_new_credential(self):
         """Test creating a new credential with encryption."""
@@ -153,66 +170,34 @@ class CredentialConfigViewTests(TestCase):
         self.assertEqual(response.status_code, 302)
         
         # Verify credential was deleted
-        self.assertEqual(Credential.objects.filter(user_id=self.test_user_id).count(), 0)
-    
-    def test_validation_user_id_required(self):
-        """Test that user_id is required."""
-        response = self.client.post(self.url, {
-            'action': 'save',
-            'user_id': '',
-            'google_oauth_token': self.test_google_token,
-            'notion_api_token': self.test_notion_token,
-            'notion_database_id': self.test_database_id,
-        })
-        
-        # Should not redirect (stays on same page with error)
-        self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'User ID is required')
-        
-        # Verify no credential was created
-        self.assertEqual(Credential.objects.count(), 0)
-    
-    def test_validation_google_token_required(self):
-        """Test that Google OAuth token is required."""
-        response = self.client.post(self.url, {
-            'action': 'save',
-            'user_id': self.test_user_id,
-            'google_oauth_token': '',
-            'notion_api_token': self.test_notion_token,
-            'notion_database_id': self.test_database_id,
-        })
-        
-        self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'Google OAuth token is required')
-        self.assertEqual(Credential.objects.count(), 0)
+        self.assertFalse(Credential.objects.filter(user_id=self.test_user_id).exists())
     
-    def test_validation_notion_token_required(self):
-        """Test that Notion API token is required."""
-        response = self.client.post(self.url, {
-            'action': 'save',
-            'user_id': self.test_user_id,
-            'google_oauth_token': self.test_google_token,
-            'notion_api_token': '',
-            'notion_database_id': self.test_database_id,
-        })
-        
-        self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'Notion API token is required')
-        self.assertEqual(Credential.objects.count(), 0)
-    
-    def test_validation_database_id_required(self):
-        """Test that Notion database ID is required."""
-        response = self.client.post(self.url, {
-            'action': 'save',
-            'user_id': self.test_user_id,
-            'google_oauth_token': self.test_google_token,
-            'notion_api_token': self.test_notion_token,
-            'notion_database_id': '',
-        })
-        
-        self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'Notion database ID is required')
-        self.assertEqual(Credential.objects.count(), 0)
+    def test_validation_required_fields(self):
+        """Test that every credential field is required."""
+        cases = [
+            ('user_id', 'User ID is required'),
+            ('google_oauth_token', 'Google OAuth token is required'),
+            ('notion_api_token', 'Notion API token is required'),
+            ('notion_database_id', 'Notion database ID is required'),
+        ]
+        for field, message in cases:
+            with self.subTest(field=field):
+                data = {
+                    'action': 'save',
+                    'user_id': self.test_user_id,
+                    'google_oauth_token': self.test_google_token,
+                    'notion_api_token': self.test_notion_token,
+                    'notion_database_id': self.test_database_id,
+                }
+                data[field] = ''
+                response = self.client.post(self.url, data)
+                
+                # Should not redirect (stays on same page with error)
+                self.assertEqual(response.status_code, 200)
+                self.assertContains(response, message)
+                
+                # Verify no credential was created
+                self.assertFalse(Credential.objects.exists())
     
     def test_edit_credential_loads_form(self):
         """Test that selecting a credential for editing loads the form."""
@@ -228,9 +213,10 @@ class CredentialConfigViewTests(TestCase):
         response = self.client.get(f'{self.url}?user_id={self.test_user_id}')
         
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, f'Edit Credentials for {self.test_user_id}')
-        self.assertContains(response, self.test_database_id)
-        self.assertContains(response, '********')  # Masked tokens
+        content = response.content.decode('utf-8')
+        self.assertIn(f'Edit Credentials for {self.test_user_id}', content)
+        self.assertIn(self.test_database_id, content)
+        self.assertIn('********', content)  # Masked tokens
     
     def test_delete_nonexistent_credential(self):
         """Test deleting a credential that doesn't exist."""
@@ -245,7 +231,7 @@ class CredentialConfigViewTests(TestCase):
     def test_encryption_error_handling(self):
         """Test that encryption errors are handled gracefully."""
         # Patch the encryption service to raise an error
-        with patch('sync_admin.views.EncryptionService') as mock_enc:
+        with patch('sync_admin.views._get_encryption_service') as mock_enc:
             mock_enc.return_value.encrypt.side_effect = Exception('Encryption failed')
             
             response = self.client.post(self.url, {
@@ -258,27 +244,22 @@ class CredentialConfigViewTests(TestCase):
             
             self.assertEqual(response.status_code, 200)
             self.assertContains(response, 'Failed to save credentials')
-            self.assertEqual(Credential.objects.count(), 0)
+            self.assertFalse(Credential.objects.exists())
     
-    def test_multiple_credentials_displayed(self):
-        """Test that multiple credentials are displayed correctly."""
-        # Create multiple credentials
+    def test_clear_sync_state(self):
+        """Test that clearing sync state deletes and counts records in one query."""
         for i in range(3):
-            Credential.objects.create(
-                user_id=f'user{i}@example.com',
-                google_oauth_token=f'encrypted_google_{i}',
-                notion_api_token=f'encrypted_notion_{i}',
-                notion_database_id=f'database_id_{i}'
+            SyncState.objects.create(
+                user_id=self.test_user_id,
+                keep_note_id=f'note_{i}',
+                notion_page_id=f'page_{i}',
+                keep_modified_at=timezone.now(),
             )
+        url = reverse('clear_sync_state', args=[self.test_user_id])
         
-        response = self.client.get(self.url)
+        with self.assertNumQueries(1):
+            response = self.client.post(url)
         
-        self.assertEqual(response.status_code, 200)
-        for i in range(3):
-            self.assertContains(response, f'user{i}@example.com')
-            self.assertContains(response, f'database_id_{i}')
-
-
-if __name__ == '__main__':
-    import unittest
-    unittest.main()
+        self.assertFalse(SyncState.objects.exists())
+        response = self.client.get(response.url)
+        self.assertContains(response, 'Cleared 3 sync state record(s)')
@@ -8,31 +8,33 @@ import os
 import sys
 import django
 
-# Setup Django
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'admin_project.settings')
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-django.setup()
+# Setup Django when run as a script; under pytest, pytest-django has
+# already done so
+if __name__ == '__main__':
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'admin_project.settings')
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    django.setup()
 
 from sync_admin.models import SyncJob, SyncState, Credential
+from django.db.models import Count, Q
 from django.utils import timezone
 from datetime import timedelta
-import uuid
 
 
 def create_test_data():
     """Create some test data for the dashboard."""
     print("Creating test data...")
     
-    # Create a test user credential
+    # Create a test user credential; one INSERT that keeps an existing row
     try:
-        cred = Credential.objects.get_or_create(
-            user_id='test_user_dashboard',
-            defaults={
-                'google_oauth_token': 'test_token_encrypted',
-                'notion_api_token': 'test_token_encrypted',
-                'notion_database_id': 'test_db_id'
-            }
-        )
+        Credential.objects.bulk_create([
+            Credential(
+                user_id='test_user_dashboard',
+                google_oauth_token='test_token_encrypted',
+                notion_api_token='test_token_encrypted',
+                notion_database_id='test_db_id'
+            )
+        ], ignore_conflicts=True)
         print(f"✓ Created/found credential for test_user_dashboard")
     except Exception as e:
         print(f"✗ Error creating credential: {e}")
@@ -80,31 +82,29 @@ def create_test_data():
         }
     ]
     
-    for job_data in jobs_data:
-        try:
-            job = SyncJob.objects.create(
-                job_id=uuid.uuid4(),
-                **job_data
-            )
+    try:
+        jobs = SyncJob.objects.bulk_create(
+            [SyncJob(**job_data) for job_data in jobs_data]
+        )
+        for job in jobs:
             print(f"✓ Created sync job: {job.job_id} ({job.status})")
-        except Exception as e:
-            print(f"✗ Error creating sync job: {e}")
+    except Exception as e:
+        print(f"✗ Error creating sync jobs: {e}")
     
-    # Create some sync state records
-    for i in range(10):
-        try:
-            state = SyncState.objects.get_or_create(
+    # Create some sync state records; rows left by an earlier run are kept
+    try:
+        SyncState.objects.bulk_create([
+            SyncState(
                 user_id='test_user_dashboard',
                 keep_note_id=f'keep_note_dashboard_{i}',
-                defaults={
-                    'notion_page_id': f'notion_page_dashboard_{i}',
-                    'keep_modified_at': timezone.now() - timedelta(days=i)
-                }
+                notion_page_id=f'notion_page_dashboard_{i}',
+                keep_modified_at=timezone.now() - timedelta(days=i)
             )
-            if i == 0:
-                print(f"✓ Created/found sync state records")
-        except Exception as e:
-            print(f"✗ Error creating sync state: {e}")
+            for i in range(10)
+        ], ignore_conflicts=True)
+        print(f"✓ Created/found sync state records")
+    except Exception as e:
+        print(f"✗ Error creating sync state: {e}")
     
     print("\nTest data created successfully!")
     print("\nYou can now:")
@@ -119,17 +119,20 @@ def show_stats():
     print("Current Database Statistics:")
     print("=" * 70)
     
-    total_jobs = SyncJob.objects.count()
-    completed = SyncJob.objects.filter(status='completed').count()
-    failed = SyncJob.objects.filter(status='failed').count()
-    running = SyncJob.objects.filter(status='running').count()
-    queued = SyncJob.objects.filter(status='queued').count()
+    # One aggregate query, as in the dashboard view
+    job_stats = SyncJob.objects.aggregate(
+        total=Count('pk'),
+        completed=Count('pk', filter=Q(status='completed')),
+        failed=Count('pk', filter=Q(status='failed')),
+        running=Count('pk', filter=Q(status='running')),
+        queued=Count('pk', filter=Q(status='queued')),
+    )
     
-    print(f"Total Sync Jobs: {total_jobs}")
-    print(f"  - Completed: {completed}")
-    print(f"  - Failed: {failed}")
-    print(f"  - Running: {running}")
-    print(f"  - Queued: {queued}")
+    print(f"Total Sync Jobs: {job_stats['total']}")
+    print(f"  - Completed: {job_stats['completed']}")
+    print(f"  - Failed: {job_stats['failed']}")
+    print(f"  - Running: {job_stats['running']}")
+    print(f"  - Queued: {job_stats['queued']}")
     
     total_states = SyncState.objects.count()
     print(f"\nTotal Sync States: {total_states}")
@@ -2,21 +2,19 @@
 Unit tests for manual sync trigger functionality.
 
 Requirements: 6.2 - Provide form to manually trigger sync jobs
-"""
-
-import os
-import sys
-import django
 
-# Setup Django
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'admin_project.settings')
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-django.setup()
+Run with ``pytest`` from services/admin_interface (or
+``python manage.py test``).
+"""
 
+import httpx
+import json
 import pytest
-from django.test import TestCase, Client
+import respx
+from django.conf import settings
+from django.test import TestCase
 from django.urls import reverse
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from sync_admin.models import Credential, SyncJob
 import uuid
 
@@ -24,32 +22,42 @@ import uuid
 class ManualSyncTriggerTestCase(TestCase):
     """Test cases for manual sync trigger view."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.client = Client()
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test fixtures once for the whole test case."""
+        cls.trigger_url = reverse('manual_sync_trigger')
+        cls.bulk_trigger_url = reverse('bulk_manual_sync_trigger')
+        cls.list_url = reverse('sync_job_list')
         
         # Create test credentials
-        self.test_user_id = "test_user_1"
-        self.credential = Credential.objects.create(
-            user_id=self.test_user_id,
+        cls.test_user_id = "test_user_1"
+        cls.credential = Credential.objects.create(
+            user_id=cls.test_user_id,
             google_oauth_token="encrypted_google_token",
             notion_api_token="encrypted_notion_token",
             notion_database_id="test_database_id"
         )
         
         # Create another test user
-        self.test_user_id_2 = "test_user_2"
-        self.credential_2 = Credential.objects.create(
-            user_id=self.test_user_id_2,
+        cls.test_user_id_2 = "test_user_2"
+        cls.credential_2 = Credential.objects.create(
+            user_id=cls.test_user_id_2,
             google_oauth_token="encrypted_google_token_2",
             notion_api_token="encrypted_notion_token_2",
             notion_database_id="test_database_id_2"
         )
     
+    def setUp(self):
+        """Intercept every request to the Sync Service at the httpx transport."""
+        self.sync_service = respx.mock(
+            base_url=settings.SYNC_SERVICE_URL, assert_all_called=False
+        )
+        self.sync_service.start()
+        self.addCleanup(self.sync_service.stop)
+    
     def test_get_manual_sync_trigger_page(self):
         """Test GET request to manual sync trigger page."""
-        url = reverse('manual_sync_trigger')
-        response = self.client.get(url)
+        response = self.client.get(self.trigger_url)
         
         # Check response status
         assert response.status_code == 200
@@ -71,181 +79,126 @@ class ManualSyncTriggerTestCase(TestCase):
         assert self.test_user_id in content
         assert self.test_user_id_2 in content
     
-    @patch('sync_admin.views.httpx.Client')
-    def test_post_manual_sync_trigger_incremental(self, mock_httpx_client):
-        """Test POST request to trigger incremental sync."""
-        # Mock the HTTP response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        test_job_id = str(uuid.uuid4())
-        mock_response.json.return_value = {
-            'job_id': test_job_id,
-            'status': 'queued'
-        }
-        
-        mock_client_instance = MagicMock()
-        mock_client_instance.__enter__.return_value = mock_client_instance
-        mock_client_instance.__exit__.return_value = None
-        mock_client_instance.post.return_value = mock_response
-        mock_httpx_client.return_value = mock_client_instance
-        
-        # Make POST request
-        url = reverse('manual_sync_trigger')
-        response = self.client.post(url, {
-            'user_id': self.test_user_id,
-            'sync_type': 'incremental'
-        })
-        
-        # Check redirect to job detail page
-        assert response.status_code == 302
-        assert f'/sync-jobs/{test_job_id}/' in response.url
-        
-        # Verify HTTP client was called correctly
-        mock_client_instance.post.assert_called_once()
-        call_args = mock_client_instance.post.call_args
-        assert '/internal/sync/execute' in call_args[0][0]
-        assert call_args[1]['json']['user_id'] == self.test_user_id
-        assert call_args[1]['json']['full_sync'] is False
-    
-    @patch('sync_admin.views.httpx.Client')
-    def test_post_manual_sync_trigger_full(self, mock_httpx_client):
-        """Test POST request to trigger full sync."""
-        # Mock the HTTP response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
+    def test_post_manual_sync_trigger(self):
+        """Test POST requests to the manual sync trigger form."""
         test_job_id = str(uuid.uuid4())
-        mock_response.json.return_value = {
-            'job_id': test_job_id,
-            'status': 'queued'
-        }
-        
-        mock_client_instance = MagicMock()
-        mock_client_instance.__enter__.return_value = mock_client_instance
-        mock_client_instance.__exit__.return_value = None
-        mock_client_instance.post.return_value = mock_response
-        mock_httpx_client.return_value = mock_client_instance
-        
-        # Make POST request
-        url = reverse('manual_sync_trigger')
-        response = self.client.post(url, {
-            'user_id': self.test_user_id,
-            'sync_type': 'full'
-        })
-        
-        # Check redirect to job detail page
-        assert response.status_code == 302
-        assert f'/sync-jobs/{test_job_id}/' in response.url
-        
-        # Verify HTTP client was called correctly
-        mock_client_instance.post.assert_called_once()
-        call_args = mock_client_instance.post.call_args
-        assert call_args[1]['json']['user_id'] == self.test_user_id
-        assert call_args[1]['json']['full_sync'] is True
+        incremental = {'user_id': self.test_user_id, 'sync_type': 'incremental'}
+        full = {'user_id': self.test_user_id, 'sync_type': 'full'}
+        
+        # (case, POST data, Sync Service response, expected full_sync,
+        # expected error message); the Sync Service is not called when its
+        # response is None
+        cases = [
+            ('incremental', incremental,
+             httpx.Response(200, json={'job_id': test_job_id, 'status': 'queued'}),
+             False, None),
+            ('full', full,
+             httpx.Response(200, json={'job_id': test_job_id, 'status': 'queued'}),
+             True, None),
+            ('missing user', {'sync_type': 'incremental'}, None,
+             None, 'select a user'),
+            ('missing sync type', {'user_id': self.test_user_id}, None,
+             None, 'select a sync type'),
+            ('user without credentials',
+             {'user_id': 'nonexistent_user', 'sync_type': 'incremental'}, None,
+             None, 'no credentials found'),
+            ('sync service error', incremental,
+             httpx.Response(500, text="Internal Server Error"),
+             None, 'failed to initiate'),
+            ('connection error', incremental, httpx.ConnectError,
+             None, 'failed to connect'),
+        ]
+        
+        route = self.sync_service.post('/internal/sync/execute')
+        for case, post_data, sync_response, full_sync, error in cases:
+            with self.subTest(case):
+                self.sync_service.reset()
+                if isinstance(sync_response, httpx.Response):
+                    route.mock(return_value=sync_response)
+                else:
+                    route.mock(side_effect=sync_response)
+                
+                # A fresh client, so no message is left over from a redirect
+                response = self.client_class().post(self.trigger_url, post_data)
+                assert route.called is (sync_response is not None)
+                
+                if error is None:
+                    # Redirected to the job detail page
+                    assert response.status_code == 302
+                    assert f'/sync-jobs/{test_job_id}/' in response.url
+                    payload = json.loads(route.calls.last.request.content)
+                    assert payload == {
+                        'user_id': self.test_user_id,
+                        'full_sync': full_sync,
+                    }
+                else:
+                    # Back to the form with an error message
+                    assert response.status_code == 200
+                    self.assertTemplateUsed(response, 'manual_sync_trigger.html')
+                    messages = list(response.context['messages'])
+                    assert len(messages) > 0
+                    assert error in str(messages[0]).lower()
     
-    def test_post_manual_sync_trigger_missing_user(self):
-        """Test POST request with missing user_id."""
-        url = reverse('manual_sync_trigger')
-        response = self.client.post(url, {
-            'sync_type': 'incremental'
-        })
+    @patch('sync_admin.views.MAX_USER_CHOICES', 1)
+    def test_manual_sync_trigger_many_users(self):
+        """Test that the user dropdown is capped and falls back to a text input."""
+        response = self.client.get(self.trigger_url)
         
-        # Should return to form with error
         assert response.status_code == 200
-        self.assertTemplateUsed(response, 'manual_sync_trigger.html')
-        
-        # Check for error message in messages
-        messages = list(response.context['messages'])
-        assert len(messages) > 0
-        assert 'select a user' in str(messages[0]).lower()
-    
-    def test_post_manual_sync_trigger_missing_sync_type(self):
-        """Test POST request with missing sync_type."""
-        url = reverse('manual_sync_trigger')
-        response = self.client.post(url, {
-            'user_id': self.test_user_id
-        })
-        
-        # Should return to form with error
-        assert response.status_code == 200
-        self.assertTemplateUsed(response, 'manual_sync_trigger.html')
+        assert response.context['users'] == [self.test_user_id]
+        assert response.context['users_truncated'] is True
+        # "Sync All Users" still reports every user it would sync
+        assert response.context['user_count'] == 2
         
-        # Check for error message
-        messages = list(response.context['messages'])
-        assert len(messages) > 0
-        assert 'select a sync type' in str(messages[0]).lower()
+        content = response.content.decode('utf-8')
+        assert '<datalist id="user_id_options">' in content
     
-    def test_post_manual_sync_trigger_user_without_credentials(self):
-        """Test POST request with user that has no credentials."""
-        url = reverse('manual_sync_trigger')
-        response = self.client.post(url, {
-            'user_id': 'nonexistent_user',
-            'sync_type': 'incremental'
-        })
-        
-        # Should return to form with error
-        assert response.status_code == 200
-        self.assertTemplateUsed(response, 'manual_sync_trigger.html')
-        
-        # Check for error message
-        messages = list(response.context['messages'])
-        assert len(messages) > 0
-        assert 'no credentials found' in str(messages[0]).lower()
+    @patch('sync_admin.views.BULK_SYNC_BATCH_SIZE', 1)
+    @patch('sync_admin.views.BULK_SYNC_MAX_IN_FLIGHT', 1)
+    def test_bulk_manual_sync_trigger(self):
+        """Test triggering a sync for all users sends every batch to the Sync Service."""
+        route = self.sync_service.post('/internal/sync/execute_bulk').respond(200)
+        
+        response = self.client.post(self.bulk_trigger_url, {'sync_type': 'full'})
+        
+        self.assertRedirects(response, self.list_url, fetch_redirect_response=False)
+        assert route.call_count == 2
+        payloads = sorted(
+            (json.loads(call.request.content) for call in route.calls),
+            key=lambda batch: batch[0]['user_id'],
+        )
+        assert payloads == [
+            [{'user_id': self.test_user_id, 'full_sync': True}],
+            [{'user_id': self.test_user_id_2, 'full_sync': True}],
+        ]
     
-    @patch('sync_admin.views.httpx.Client')
-    def test_post_manual_sync_trigger_sync_service_error(self, mock_httpx_client):
-        """Test POST request when Sync Service returns an error."""
-        # Mock the HTTP response with error
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
+    @patch('sync_admin.views._async_client', None)
+    def test_wsgi_request_does_not_keep_a_pooled_client(self):
+        """Test that a WSGI request closes its own client rather than pooling one."""
+        from sync_admin import views
         
-        mock_client_instance = MagicMock()
-        mock_client_instance.__enter__.return_value = mock_client_instance
-        mock_client_instance.__exit__.return_value = None
-        mock_client_instance.post.return_value = mock_response
-        mock_httpx_client.return_value = mock_client_instance
+        self.sync_service.post('/internal/sync/execute').respond(
+            200, json={'job_id': str(uuid.uuid4()), 'status': 'queued'}
+        )
         
-        # Make POST request
-        url = reverse('manual_sync_trigger')
-        response = self.client.post(url, {
+        self.client.post(self.trigger_url, {
             'user_id': self.test_user_id,
-            'sync_type': 'incremental'
+            'sync_type': 'incremental',
         })
         
-        # Should return to form with error
-        assert response.status_code == 200
-        self.assertTemplateUsed(response, 'manual_sync_trigger.html')
-        
-        # Check for error message
-        messages = list(response.context['messages'])
-        assert len(messages) > 0
-        assert 'failed to initiate' in str(messages[0]).lower()
+        # The event loop of this request is gone; nothing may outlive it
+        assert views._async_client is None
     
-    @patch('sync_admin.views.httpx.Client')
-    def test_post_manual_sync_trigger_connection_error(self, mock_httpx_client):
-        """Test POST request when connection to Sync Service fails."""
-        # Mock connection error
-        import httpx
-        mock_client_instance = MagicMock()
-        mock_client_instance.__enter__.return_value = mock_client_instance
-        mock_client_instance.__exit__.return_value = None
-        mock_client_instance.post.side_effect = httpx.RequestError("Connection failed")
-        mock_httpx_client.return_value = mock_client_instance
-        
-        # Make POST request
-        url = reverse('manual_sync_trigger')
-        response = self.client.post(url, {
-            'user_id': self.test_user_id,
-            'sync_type': 'incremental'
-        })
+    def test_bulk_manual_sync_trigger_connection_error(self):
+        """Test triggering a sync for all users when the Sync Service is unreachable."""
+        self.sync_service.post('/internal/sync/execute_bulk').mock(
+            side_effect=httpx.ConnectError
+        )
         
-        # Should return to form with error
-        assert response.status_code == 200
-        self.assertTemplateUsed(response, 'manual_sync_trigger.html')
+        response = self.client.post(self.bulk_trigger_url, {'sync_type': 'incremental'}, follow=True)
         
-        # Check for error message
+        self.assertRedirects(response, self.trigger_url)
         messages = list(response.context['messages'])
-        assert len(messages) > 0
         assert 'failed to connect' in str(messages[0]).lower()
     
     def test_manual_sync_trigger_no_users(self):
@@ -253,8 +206,7 @@ class ManualSyncTriggerTestCase(TestCase):
         # Delete all credentials
         Credential.objects.all().delete()
         
-        url = reverse('manual_sync_trigger')
-        response = self.client.get(url)
+        response = self.client.get(self.trigger_url)
         
         # Check response
         assert response.status_code == 200
@@ -262,31 +214,3 @@ class ManualSyncTriggerTestCase(TestCase):
         # Check that warning is displayed
         content = response.content.decode('utf-8')
         assert 'No users found' in content or 'no users' in content.lower()
-
-
-def run_tests():
-    """Run the manual sync trigger tests."""
-    from django.test.utils import get_runner
-    from django.conf import settings
-    
-    TestRunner = get_runner(settings)
-    test_runner = TestRunner(verbosity=2, interactive=False, keepdb=False)
-    
-    # Run only this test case
-    failures = test_runner.run_tests(['__main__'])
-    
-    return failures
-
-
-if __name__ == '__main__':
-    print("Running manual sync trigger tests...")
-    print("=" * 70)
-    
-    failures = run_tests()
-    
-    print("=" * 70)
-    if failures == 0:
-        print("✓ All manual sync trigger tests passed!")
-    else:
-        print(f"✗ {failures} test(s) failed")
-        sys.exit(1)
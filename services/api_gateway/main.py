@@ -1,18 +1,22 @@
 """API Gateway - FastAPI application."""
 
+import asyncio
+import hmac
 import logging
 import sys
 import os
+import time
 from contextlib import asynccontextmanager
 from typing import Optional
 from uuid import uuid4, UUID
 from datetime import datetime
 
-from fastapi import FastAPI, Request, status, HTTPException, Header, Depends
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, status, HTTPException
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 import httpx
+import orjson
 
 # Add shared module to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../'))
@@ -27,7 +31,8 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-# Global instances
+# Global instances. DatabaseOperations is synchronous, so async handlers
+# call it through asyncio.to_thread to keep queries off the event loop
 db_ops: Optional[DatabaseOperations] = None
 sync_client: Optional[httpx.AsyncClient] = None
 
@@ -37,7 +42,21 @@ def get_sync_service_url() -> str:
     return os.getenv("SYNC_SERVICE_URL", "http://localhost:8005")
 
 
-def get_api_keys() -> set:
+def get_sync_client_limits() -> httpx.Limits:
+    """
+    Get the connection pool limits for the Sync Service client from environment.
+    
+    Every sync request is forwarded to the Sync Service, so idle connections
+    are kept open (for 30 seconds) to be reused instead of reconnecting.
+    """
+    return httpx.Limits(
+        max_connections=int(os.getenv("SYNC_CLIENT_MAX_CONN", "200")),
+        max_keepalive_connections=int(os.getenv("SYNC_CLIENT_KEEPALIVE", "50")),
+        keepalive_expiry=30.0,
+    )
+
+
+def get_api_keys() -> frozenset:
     """
     Get valid API keys from environment.
     
@@ -46,47 +65,84 @@ def get_api_keys() -> set:
     
     For now, we support a comma-separated list of API keys in the API_KEYS environment variable.
     If not set, we use a default key for development.
+    
+    Keys are returned encoded as bytes, the form ASGI request headers arrive
+    in, so checking a request does not decode its header.
     """
     api_keys_str = os.getenv("API_KEYS", "dev-api-key-12345")
-    return set(key.strip() for key in api_keys_str.split(",") if key.strip())
+    return frozenset(key.strip().encode() for key in api_keys_str.split(",") if key.strip())
 
 
 # Load valid API keys at startup
 VALID_API_KEYS = get_api_keys()
 
 
-async def verify_api_key(x_api_key: Optional[str] = Header(None, description="API key for authentication")):
+class ApiKeyASGIMiddleware:
+    """
+    Authentication middleware for the sync endpoints.
+    
+    Requests under the protected path prefix must carry a valid API key in
+    the X-API-Key header. The key is checked on the raw ASGI headers before
+    routing and compared against every valid key in constant time, so the
+    response time does not reveal how much of a guessed key matched.
+    Missing or invalid keys get a 401 with the same body an HTTPException
+    would produce.
     """
-    Verify API key from request header.
     
-    This dependency validates that the request includes a valid API key in the X-API-Key header.
+    MISSING_KEY_BODY = orjson.dumps(
+        {"detail": "Missing API key. Please provide X-API-Key header."}
+    )
+    INVALID_KEY_BODY = orjson.dumps({"detail": "Invalid API key"})
     
-    Args:
-        x_api_key: API key from X-API-Key header
+    def __init__(self, app, valid_keys: frozenset, protected_prefix: str = "/api/v1/sync"):
+        """
+        Initialize the middleware.
         
-    Raises:
-        HTTPException: 401 if API key is missing or invalid
+        Args:
+            app: The ASGI application to wrap
+            valid_keys: Accepted API keys, encoded as bytes
+            protected_prefix: Path prefix of the endpoints that require a key
+        """
+        self.app = app
+        self.valid_keys = valid_keys
+        self.protected_prefix = protected_prefix
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.protected_prefix):
+            await self.app(scope, receive, send)
+            return
         
-    Returns:
-        str: The validated API key
-    """
-    if not x_api_key:
-        logger.warning("Request missing API key")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Missing API key. Please provide X-API-Key header.",
-            headers={"WWW-Authenticate": "ApiKey"}
-        )
-    
-    if x_api_key not in VALID_API_KEYS:
-        logger.warning(f"Invalid API key attempted: {x_api_key[:10]}...")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid API key",
-            headers={"WWW-Authenticate": "ApiKey"}
-        )
-    
-    return x_api_key
+        api_key = None
+        for name, value in scope["headers"]:
+            if name == b"x-api-key":
+                api_key = value
+                break
+        
+        if not api_key:
+            logger.warning("Request missing API key")
+            await self._reject(send, self.MISSING_KEY_BODY)
+            return
+        
+        if not any(hmac.compare_digest(api_key, key) for key in self.valid_keys):
+            logger.warning(f"Invalid API key attempted: {api_key[:10].decode('latin-1')}...")
+            await self._reject(send, self.INVALID_KEY_BODY)
+            return
+        
+        await self.app(scope, receive, send)
+    
+    @staticmethod
+    async def _reject(send, body: bytes):
+        """Send a 401 response with a pre-serialized JSON body."""
+        await send({
+            "type": "http.response.start",
+            "status": status.HTTP_401_UNAUTHORIZED,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"www-authenticate", b"ApiKey"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
 
 
 @asynccontextmanager
@@ -103,13 +159,19 @@ async def lifespan(app: FastAPI):
     # Initialize HTTP client for Sync Service
     sync_client = httpx.AsyncClient(
         base_url=get_sync_service_url(),
-        timeout=300.0  # 5 minutes for long-running operations
+        timeout=300.0,  # 5 minutes for long-running operations
+        limits=get_sync_client_limits(),
+        # Retry a failed connection attempt once; requests that reached the
+        # Sync Service are never retried
+        transport=httpx.AsyncHTTPTransport(retries=1),
     )
     logger.info(f"HTTP client initialized - Sync Service: {get_sync_service_url()}")
     
     yield
     
-    # Cleanup
+    # Cleanup; let sync jobs that are still being forwarded finish first
+    if _background_tasks:
+        await asyncio.gather(*_background_tasks, return_exceptions=True)
     await sync_client.aclose()
     logger.info("API Gateway shutting down...")
 
@@ -119,7 +181,16 @@ app = FastAPI(
     title="API Gateway",
     description="REST API for Google Keep to Notion Sync",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+
+# Add authentication middleware. It is added first so that it runs inside
+# CORS: preflight requests are answered without a key, and 401 responses
+# still carry the CORS headers
+app.add_middleware(
+    ApiKeyASGIMiddleware,
+    valid_keys=VALID_API_KEYS,
 )
 
 # Add CORS middleware
@@ -133,13 +204,14 @@ app.add_middleware(
 
 
 # Error handling middleware
-@app.middleware("http")
-async def error_handling_middleware(request: Request, call_next):
+class ErrorHandlingMiddleware:
     """
     Global error handling middleware.
     
     This middleware catches all unhandled exceptions and returns appropriate
-    HTTP status codes with descriptive error messages.
+    HTTP status codes with descriptive error messages. It is a plain ASGI
+    middleware: requests pass straight through to the application, and a
+    response object is only built when an exception has to be reported.
     
     Error codes:
     - 400: Bad Request (validation errors, invalid input)
@@ -150,34 +222,59 @@ async def error_handling_middleware(request: Request, call_next):
     - 503: Service Unavailable (service is down)
     - 504: Gateway Timeout (upstream service timeout)
     """
-    try:
-        response = await call_next(request)
-        return response
-    except HTTPException:
-        # Re-raise HTTPExceptions to be handled by FastAPI
-        raise
-    except ValueError as exc:
-        # Validation errors
-        logger.warning(f"Validation error: {exc}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "error": "Bad Request",
-                "detail": str(exc),
-                "type": "validation_error"
-            }
-        )
-    except Exception as exc:
-        # Unexpected errors
-        logger.error(f"Unhandled exception: {exc}", exc_info=True)
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "error": "Internal Server Error",
-                "detail": "An unexpected error occurred. Please try again later.",
-                "type": "internal_error"
-            }
-        )
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_wrapper(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except HTTPException:
+            # Re-raise HTTPExceptions to be handled by FastAPI
+            raise
+        except Exception as exc:
+            if response_started:
+                # Too late to replace the response; let the server close it
+                raise
+            
+            if isinstance(exc, ValueError):
+                # Validation errors
+                logger.warning(f"Validation error: {exc}")
+                response = ORJSONResponse(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    content={
+                        "error": "Bad Request",
+                        "detail": str(exc),
+                        "type": "validation_error"
+                    }
+                )
+            else:
+                # Unexpected errors
+                logger.error(f"Unhandled exception: {exc}", exc_info=True)
+                response = ORJSONResponse(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    content={
+                        "error": "Internal Server Error",
+                        "detail": "An unexpected error occurred. Please try again later.",
+                        "type": "internal_error"
+                    }
+                )
+            await response(scope, receive, send)
+
+
+app.add_middleware(ErrorHandlingMiddleware)
 
 
 # Health check endpoint
@@ -197,6 +294,15 @@ class HealthCheckResponse(BaseModel):
     services: dict = Field(..., description="Status of individual services")
 
 
+# Health check results are reused for this many seconds, so frequent probes
+# (load balancers, orchestrators, dashboards) do not each hit the Sync
+# Service and the database
+HEALTH_CACHE_TTL = 5.0
+
+_health_cache: Optional[tuple[float, HealthCheckResponse]] = None
+_health_lock = asyncio.Lock()
+
+
 @app.get("/api/v1/health", response_model=HealthCheckResponse, status_code=status.HTTP_200_OK)
 async def api_health_check():
     """
@@ -207,45 +313,83 @@ async def api_health_check():
     2. Checks connectivity to the database
     3. Returns overall status (healthy if all services are up, degraded otherwise)
     
+    The result is cached for HEALTH_CACHE_TTL seconds. Only one request at a
+    time runs the checks; concurrent requests wait for it and reuse its
+    result.
+    
     Returns:
         HealthCheckResponse with overall status and individual service statuses
     """
+    global _health_cache
+    
     logger.info("Health check requested")
     
+    if _health_cache and time.monotonic() - _health_cache[0] < HEALTH_CACHE_TTL:
+        return _health_cache[1]
+    
+    async with _health_lock:
+        # Another request may have refreshed the result while this one waited
+        if _health_cache and time.monotonic() - _health_cache[0] < HEALTH_CACHE_TTL:
+            return _health_cache[1]
+        
+        health = await _check_services()
+        _health_cache = (time.monotonic(), health)
+    
+    return health
+
+
+async def _check_services() -> HealthCheckResponse:
+    """
+    Check the Sync Service and the database.
+    
+    Returns:
+        HealthCheckResponse with overall status and individual service statuses
+    """
+    # Both checks run concurrently; the database call is blocking, so it
+    # runs in a worker thread
+    sync_service_up, database_up = await asyncio.gather(
+        _check_sync_service(),
+        asyncio.to_thread(_check_database),
+    )
     services_status = {
-        "sync_service": "down",
-        "database": "down"
+        "sync_service": "up" if sync_service_up else "down",
+        "database": "up" if database_up else "down"
     }
     
-    # Check Sync Service connectivity
+    # Determine overall status
+    overall_status = "healthy" if all(s == "up" for s in services_status.values()) else "degraded"
+    
+    logger.info(f"Health check completed - status: {overall_status}, services: {services_status}")
+    
+    return HealthCheckResponse(
+        status=overall_status,
+        services=services_status
+    )
+
+
+async def _check_sync_service() -> bool:
+    """Return whether the Sync Service answers its health endpoint."""
     try:
         response = await sync_client.get("/health", timeout=5.0)
         if response.status_code == 200:
-            services_status["sync_service"] = "up"
             logger.debug("Sync Service is up")
-        else:
-            logger.warning(f"Sync Service returned non-200 status: {response.status_code}")
+            return True
+        logger.warning(f"Sync Service returned non-200 status: {response.status_code}")
     except (httpx.TimeoutException, httpx.RequestError) as e:
         logger.warning(f"Sync Service health check failed: {e}")
-    
-    # Check database connectivity
+    return False
+
+
+def _check_database() -> bool:
+    """Return whether the database answers a simple query."""
     try:
         # Try a simple database operation to verify connectivity
         db_ops.get_sync_jobs(limit=1, offset=0)
-        services_status["database"] = "up"
         logger.debug("Database is up")
+        return True
     except Exception as e:
         logger.warning(f"Database health check failed: {e}")
-    
-    # Determine overall status
-    overall_status = "healthy" if all(s == "up" for s in services_status.values()) else "degraded"
-    
-    logger.info(f"Health check completed - status: {overall_status}, services: {services_status}")
-    
-    return HealthCheckResponse(
-        status=overall_status,
-        services=services_status
-    )
+        return False
 
 
 @app.get("/", status_code=status.HTTP_200_OK)
@@ -289,21 +433,80 @@ class SyncStatusResponse(BaseModel):
     error_message: Optional[str] = Field(None, description="Error message if job failed")
 
 
+# References to in-flight forwarding tasks, so they are not garbage
+# collected before they finish
+_background_tasks: set[asyncio.Task] = set()
+
+
+async def _forward_to_sync_service(job_id: UUID, user_id: str, full_sync: bool):
+    """
+    Forward a new sync job to the Sync Service.
+    
+    Runs in the background after start_sync has responded. If the Sync
+    Service rejects the job or cannot be reached, the job is marked as
+    failed with the reason, which clients see through the job status
+    endpoint.
+    
+    Args:
+        job_id: The sync job ID
+        user_id: User ID to sync notes for
+        full_sync: True for full sync, False for incremental
+    """
+    try:
+        response = await sync_client.post(
+            "/internal/sync/execute",
+            json={
+                "job_id": str(job_id),
+                "user_id": user_id,
+                "full_sync": full_sync
+            },
+            timeout=5.0  # Short timeout for initial request
+        )
+        
+        if response.status_code != 200:
+            logger.error(f"Sync Service returned error: {response.status_code} - {response.text}")
+            # Update job status to failed
+            await asyncio.to_thread(
+                db_ops.update_sync_job,
+                job_id=job_id,
+                status="failed",
+                error_message=f"Sync Service error: {response.text}"
+            )
+            return
+        
+        logger.info(f"Successfully forwarded sync request to Sync Service for job {job_id}")
+        
+    except httpx.TimeoutException:
+        # Timeout is acceptable - sync is running in background
+        logger.info(f"Sync Service request timed out (expected for long-running sync) - job {job_id}")
+    except httpx.RequestError as e:
+        logger.error(f"Failed to connect to Sync Service: {e}", exc_info=True)
+        # Update job status to failed
+        await asyncio.to_thread(
+            db_ops.update_sync_job,
+            job_id=job_id,
+            status="failed",
+            error_message=f"Failed to connect to Sync Service: {str(e)}"
+        )
+    except Exception as e:
+        logger.error(f"Failed to forward sync job {job_id}: {e}", exc_info=True)
+
+
 @app.post("/api/v1/sync/start", response_model=SyncStartResponse, status_code=status.HTTP_201_CREATED)
-async def start_sync(request: SyncStartRequest, api_key: str = Depends(verify_api_key)):
+async def start_sync(request: SyncStartRequest):
     """
     Initiate a synchronization job.
     
     This endpoint:
-    1. Validates authentication (requires X-API-Key header)
+    1. Requires authentication (X-API-Key header, checked by ApiKeyASGIMiddleware)
     2. Validates the request body (user_id, full_sync)
     3. Creates a new sync job in the database
-    4. Forwards the request to the Sync Service
-    5. Returns the job_id and initial status
+    4. Forwards the request to the Sync Service in the background
+    5. Returns the job_id and initial status without waiting for the
+       Sync Service; if forwarding fails, the job is marked as failed
     
     Args:
         request: SyncStartRequest with user_id and full_sync flag
-        api_key: Validated API key from header (injected by dependency)
         
     Returns:
         SyncStartResponse with job_id, status, and created_at timestamp
@@ -313,8 +516,6 @@ async def start_sync(request: SyncStartRequest, api_key: str = Depends(verify_ap
             - 400: Invalid request (empty user_id)
             - 401: Missing or invalid API key
             - 500: Database error
-            - 502: Sync Service error
-            - 503: Sync Service unavailable
     """
     logger.info(f"Received sync start request for user {request.user_id}, full_sync={request.full_sync}")
     
@@ -332,7 +533,8 @@ async def start_sync(request: SyncStartRequest, api_key: str = Depends(verify_ap
     
     # Create sync job in database
     try:
-        sync_job = db_ops.create_sync_job(
+        sync_job = await asyncio.to_thread(
+            db_ops.create_sync_job,
             job_id=job_id,
             user_id=request.user_id,
             full_sync=request.full_sync
@@ -345,48 +547,13 @@ async def start_sync(request: SyncStartRequest, api_key: str = Depends(verify_ap
             detail=f"Failed to create sync job in database: {str(e)}"
         )
     
-    # Forward request to Sync Service
-    try:
-        response = await sync_client.post(
-            "/internal/sync/execute",
-            json={
-                "job_id": str(job_id),
-                "user_id": request.user_id,
-                "full_sync": request.full_sync
-            },
-            timeout=5.0  # Short timeout for initial request
-        )
-        
-        if response.status_code != 200:
-            logger.error(f"Sync Service returned error: {response.status_code} - {response.text}")
-            # Update job status to failed
-            db_ops.update_sync_job(
-                job_id=job_id,
-                status="failed",
-                error_message=f"Sync Service error: {response.text}"
-            )
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=f"Sync Service returned error (status {response.status_code}). Please try again later."
-            )
-        
-        logger.info(f"Successfully forwarded sync request to Sync Service for job {job_id}")
-        
-    except httpx.TimeoutException:
-        # Timeout is acceptable - sync is running in background
-        logger.info(f"Sync Service request timed out (expected for long-running sync) - job {job_id}")
-    except httpx.RequestError as e:
-        logger.error(f"Failed to connect to Sync Service: {e}", exc_info=True)
-        # Update job status to failed
-        db_ops.update_sync_job(
-            job_id=job_id,
-            status="failed",
-            error_message=f"Failed to connect to Sync Service: {str(e)}"
-        )
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Sync Service is currently unavailable. Please try again later."
-        )
+    # Forward request to Sync Service without waiting for it; failures are
+    # recorded on the job
+    task = asyncio.create_task(
+        _forward_to_sync_service(job_id, request.user_id, request.full_sync)
+    )
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
     
     # Return response with job details
     return SyncStartResponse(
@@ -397,12 +564,12 @@ async def start_sync(request: SyncStartRequest, api_key: str = Depends(verify_ap
 
 
 @app.get("/api/v1/sync/jobs/{job_id}", response_model=SyncStatusResponse, status_code=status.HTTP_200_OK)
-async def get_sync_job_status(job_id: str, api_key: str = Depends(verify_api_key)):
+async def get_sync_job_status(job_id: str):
     """
     Get the status of a sync job.
     
     This endpoint:
-    1. Validates authentication (requires X-API-Key header)
+    1. Requires authentication (X-API-Key header, checked by ApiKeyASGIMiddleware)
     2. Validates the job_id format
     3. Queries the Sync Service for current job status
     4. Returns detailed progress information including:
@@ -413,7 +580,6 @@ async def get_sync_job_status(job_id: str, api_key: str = Depends(verify_api_key
     
     Args:
         job_id: The sync job ID to query (UUID format)
-        api_key: Validated API key from header (injected by dependency)
         
     Returns:
         SyncStatusResponse with current job state and progress
@@ -519,14 +685,13 @@ class SyncHistoryResponse(BaseModel):
 async def get_sync_history(
     user_id: Optional[str] = None,
     limit: int = 50,
-    offset: int = 0,
-    api_key: str = Depends(verify_api_key)
+    offset: int = 0
 ):
     """
     Get sync job history with pagination.
     
     This endpoint:
-    1. Validates authentication (requires X-API-Key header)
+    1. Requires authentication (X-API-Key header, checked by ApiKeyASGIMiddleware)
     2. Queries the database for sync jobs with optional user filtering
     3. Supports pagination with limit and offset parameters
     4. Returns a list of sync jobs with summary information
@@ -536,7 +701,6 @@ async def get_sync_history(
         user_id: Optional user ID to filter jobs (if not provided, returns all jobs)
         limit: Maximum number of jobs to return (default: 50, max: 100)
         offset: Number of jobs to skip for pagination (default: 0)
-        api_key: Validated API key from header (injected by dependency)
         
     Returns:
         SyncHistoryResponse with list of jobs, total count, limit, and offset
@@ -566,7 +730,8 @@ async def get_sync_history(
     
     # Query database for sync jobs
     try:
-        jobs, total_count = db_ops.get_sync_jobs(
+        jobs, total_count = await asyncio.to_thread(
+            db_ops.get_sync_jobs,
             user_id=user_id,
             limit=limit,
             offset=offset
@@ -1,12 +1,13 @@
 """Sync Service - FastAPI application."""
 
+import asyncio
 import logging
 import sys
 import os
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional
-from uuid import UUID
+from typing import List, Optional
+from uuid import UUID, uuid4
 
 from fastapi import FastAPI, Request, status, HTTPException, BackgroundTasks
 from fastapi.responses import JSONResponse
@@ -45,6 +46,16 @@ def get_notion_writer_url() -> str:
     return os.getenv("NOTION_WRITER_URL", "http://localhost:8004")
 
 
+def get_max_concurrent_syncs() -> int:
+    """Get the number of bulk-queued syncs allowed to run at once."""
+    return int(os.getenv("SYNC_MAX_CONCURRENT_JOBS", "4"))
+
+
+def get_shutdown_timeout() -> float:
+    """Get how long shutdown waits for running syncs before cancelling them."""
+    return float(os.getenv("SYNC_SHUTDOWN_TIMEOUT", "30"))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events."""
@@ -74,7 +85,8 @@ async def lifespan(app: FastAPI):
     
     yield
     
-    # Cleanup
+    # Cleanup; stop bulk-queued syncs before their clients close
+    await _stop_sync_tasks(get_shutdown_timeout())
     await keep_client.aclose()
     await notion_client.aclose()
     logger.info("Sync Service shutting down...")
@@ -117,9 +129,9 @@ async def error_handling_middleware(request: Request, call_next):
 
 
 # Health check endpoint
-@app.get("/health", status_code=status.HTTP_200_OK)
+@app.api_route("/health", methods=["GET", "HEAD"], status_code=status.HTTP_200_OK)
 async def health_check():
-    """Health check endpoint."""
+    """Health check endpoint. HEAD returns the same status without the body."""
     # Check database connectivity
     db_healthy = False
     try:
@@ -185,6 +197,80 @@ class SyncExecuteResponse(BaseModel):
     error: Optional[str] = None
 
 
+# References to syncs started by /internal/sync/execute_bulk, so they are
+# not garbage collected before they finish
+_sync_tasks: set[asyncio.Task] = set()
+
+# Limits how many bulk-queued syncs run at once; the rest wait for a slot
+_sync_semaphore = asyncio.Semaphore(get_max_concurrent_syncs())
+
+
+async def _stop_sync_tasks(timeout: float):
+    """
+    Wait for bulk-queued syncs to finish, cancelling any still running.
+    
+    Args:
+        timeout: Seconds to wait before cancelling the remaining syncs
+    """
+    if not _sync_tasks:
+        return
+    
+    _, pending = await asyncio.wait(set(_sync_tasks), timeout=timeout)
+    if not pending:
+        return
+    
+    job_ids = sorted(task.get_name() for task in pending)
+    logger.warning(
+        f"Cancelling {len(pending)} sync job(s) still running at shutdown: {', '.join(job_ids)}"
+    )
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _parse_job_id(request: SyncExecuteRequest) -> UUID:
+    """
+    Return the job_id of a sync request, generating one if it is not provided.
+    
+    Raises:
+        HTTPException: 400 if the provided job_id is not a valid UUID
+    """
+    if not request.job_id:
+        return uuid4()
+    try:
+        return UUID(request.job_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid job_id format"
+        )
+
+
+def _create_orchestrator():
+    """Create a SyncOrchestrator using the service's shared clients."""
+    from services.sync_service.orchestrator import SyncOrchestrator
+    
+    return SyncOrchestrator(
+        keep_client=keep_client,
+        notion_client=notion_client,
+        db_ops=db_ops,
+        encryption_service=encryption_service
+    )
+
+
+async def _run_sync(job_id: UUID, user_id: str, full_sync: bool):
+    """Run one sync job started in the background, logging any failure."""
+    try:
+        async with _sync_semaphore:
+            await _create_orchestrator().execute_sync(
+                job_id=job_id,
+                user_id=user_id,
+                full_sync=full_sync
+            )
+    except Exception as e:
+        logger.error(f"Sync job {job_id} failed: {e}", exc_info=True)
+
+
 @app.post("/internal/sync/execute", response_model=SyncExecuteResponse, status_code=status.HTTP_200_OK)
 async def execute_sync(request: SyncExecuteRequest, background_tasks: BackgroundTasks):
     """
@@ -210,30 +296,13 @@ async def execute_sync(request: SyncExecuteRequest, background_tasks: Background
     Returns:
         SyncExecuteResponse with job_id and queued status (returns immediately)
     """
-    from services.sync_service.orchestrator import SyncOrchestrator
-    import uuid
-    
     # Generate job_id if not provided
-    if request.job_id:
-        try:
-            job_id = UUID(request.job_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid job_id format"
-            )
-    else:
-        job_id = uuid.uuid4()
+    job_id = _parse_job_id(request)
     
     logger.info(f"Received sync execute request for job {job_id}, user {request.user_id}")
     
     # Create orchestrator
-    orchestrator = SyncOrchestrator(
-        keep_client=keep_client,
-        notion_client=notion_client,
-        db_ops=db_ops,
-        encryption_service=encryption_service
-    )
+    orchestrator = _create_orchestrator()
     
     # Add sync to background tasks - this returns immediately
     background_tasks.add_task(
@@ -251,6 +320,44 @@ async def execute_sync(request: SyncExecuteRequest, background_tasks: Background
     )
 
 
+@app.post("/internal/sync/execute_bulk", response_model=List[SyncExecuteResponse], status_code=status.HTTP_200_OK)
+async def execute_sync_bulk(requests: List[SyncExecuteRequest]):
+    """
+    Queue several synchronization jobs in one call.
+    
+    Callers retrying or triggering many jobs pay one round trip instead of
+    one per job. Each job runs in its own task, so a failing sync does not
+    hold up or abort the others. At most SYNC_MAX_CONCURRENT_JOBS run at
+    once; the rest wait for a slot before their job is created.
+    
+    Args:
+        requests: SyncExecuteRequest for each job to queue
+        
+    Returns:
+        SyncExecuteResponse for each queued job, in request order
+    """
+    logger.info(f"Received bulk sync execute request for {len(requests)} job(s)")
+    
+    # Validate every job_id before starting any sync
+    job_ids = [_parse_job_id(request) for request in requests]
+    
+    responses = []
+    for job_id, request in zip(job_ids, requests):
+        task = asyncio.create_task(
+            _run_sync(job_id, request.user_id, request.full_sync),
+            name=str(job_id)
+        )
+        _sync_tasks.add(task)
+        task.add_done_callback(_sync_tasks.discard)
+        responses.append(SyncExecuteResponse(
+            job_id=str(job_id),
+            status="queued",
+            summary={"message": "Sync job queued successfully"}
+        ))
+    
+    return responses
+
+
 class SyncStatusResponse(BaseModel):
     """Response model for sync status."""
     job_id: str
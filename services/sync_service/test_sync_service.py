@@ -10,6 +10,7 @@ Tests cover:
 Requirements: 3.1, 3.2, 3.3, 4.3, 9.3, 9.4
 """
 
+import asyncio
 import pytest
 import sys
 import os
@@ -747,5 +748,100 @@ async def test_notification_service_with_context():
     )
 
 
+
+# Test: Bulk sync execution endpoint
+
+@pytest.mark.asyncio
+async def test_execute_sync_bulk_runs_jobs_concurrently():
+    """Test that bulk-queued sync jobs are created and run side by side."""
+    from services.sync_service import main as sync_main
+    
+    started = []
+    finished = []
+    both_started = asyncio.Event()
+    
+    async def fake_execute_sync(self, job_id, user_id, full_sync):
+        # Create the job as the real workflow does, then wait for the other
+        # job to start; run one after another, the first would time out
+        self.db_ops.create_sync_job(job_id=job_id, user_id=user_id, full_sync=full_sync)
+        started.append(str(job_id))
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1.0)
+        finished.append(str(job_id))
+    
+    job_ids = [str(uuid4()), str(uuid4())]
+    mock_db = Mock()
+    transport = httpx.ASGITransport(app=sync_main.app)
+    with patch.object(sync_main, 'db_ops', mock_db), \
+         patch.object(SyncOrchestrator, 'execute_sync', fake_execute_sync):
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/internal/sync/execute_bulk", json=[
+                {"job_id": job_ids[0], "user_id": "user_1"},
+                {"job_id": job_ids[1], "user_id": "user_2", "full_sync": True},
+            ])
+        
+        # The endpoint answers before the syncs run
+        assert response.status_code == 200
+        assert [job['job_id'] for job in response.json()] == job_ids
+        assert all(job['status'] == 'queued' for job in response.json())
+        
+        await asyncio.gather(*sync_main._sync_tasks)
+    
+    # Both jobs were created, and each started before the other finished
+    assert mock_db.create_sync_job.call_count == 2
+    assert sorted(started) == sorted(job_ids)
+    assert sorted(finished) == sorted(job_ids)
+
+
+@pytest.mark.asyncio
+async def test_execute_sync_bulk_limits_concurrent_syncs():
+    """Test that bulk-queued syncs wait for a free slot."""
+    from services.sync_service import main as sync_main
+    
+    running = 0
+    max_running = 0
+    
+    async def fake_execute_sync(self, job_id, user_id, full_sync):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+    
+    transport = httpx.ASGITransport(app=sync_main.app)
+    with patch.object(sync_main, 'db_ops', Mock()), \
+         patch.object(sync_main, '_sync_semaphore', asyncio.Semaphore(2)), \
+         patch.object(SyncOrchestrator, 'execute_sync', fake_execute_sync):
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/internal/sync/execute_bulk", json=[
+                {"user_id": f"user_{i}"} for i in range(5)
+            ])
+        
+        assert response.status_code == 200
+        assert len(response.json()) == 5
+        
+        await asyncio.gather(*sync_main._sync_tasks)
+    
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_stop_sync_tasks_cancels_syncs_past_timeout(caplog):
+    """Test that shutdown cancels syncs still running after the timeout."""
+    from services.sync_service import main as sync_main
+    
+    async def hanging_sync():
+        await asyncio.sleep(60)
+    
+    job_id = str(uuid4())
+    task = asyncio.create_task(hanging_sync(), name=job_id)
+    with patch.object(sync_main, '_sync_tasks', {task}):
+        await sync_main._stop_sync_tasks(timeout=0.01)
+    
+    assert task.cancelled()
+    assert job_id in caplog.text
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
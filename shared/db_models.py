@@ -2,11 +2,12 @@
 
 from datetime import datetime
 from sqlalchemy import (
-    Column, String, Integer, Boolean, Text, DateTime, ForeignKey, Index, TypeDecorator
+    Column, String, Integer, BigInteger, Boolean, Text, DateTime, ForeignKey, Index, TypeDecorator,
+    UniqueConstraint
 )
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 import uuid
 
 
@@ -46,6 +47,10 @@ class UUID(TypeDecorator):
             return value
 
 
+# BIGINT primary key that still autoincrements on SQLite (used in tests)
+BigIntegerPK = BigInteger().with_variant(Integer, 'sqlite')
+
+
 Base = declarative_base()
 
 
@@ -55,7 +60,7 @@ class SyncJob(Base):
     
     job_id = Column(UUID(), primary_key=True)
     user_id = Column(String(255), nullable=False)
-    status = Column(String(50), nullable=False)
+    status = Column(String(50), nullable=False)  # sync_status enum in Postgres
     full_sync = Column(Boolean, default=False)
     total_notes = Column(Integer, default=0)
     processed_notes = Column(Integer, default=0)
@@ -66,6 +71,13 @@ class SyncJob(Base):
     
     __table_args__ = (
         Index('idx_sync_jobs_user_created', 'user_id', 'created_at'),
+        Index('idx_sync_jobs_status_created', 'status', 'created_at'),
+        Index('idx_sync_jobs_created', 'created_at'),
+        Index(
+            'idx_sync_jobs_active', 'user_id', 'created_at',
+            postgresql_where=text("status IN ('queued', 'running')"),
+            sqlite_where=text("status IN ('queued', 'running')"),
+        ),
     )
 
 
@@ -73,7 +85,7 @@ class SyncState(Base):
     """Model for sync_state table."""
     __tablename__ = 'sync_state'
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(BigIntegerPK, primary_key=True, autoincrement=True)
     user_id = Column(String(255), nullable=False)
     keep_note_id = Column(String(255), nullable=False)
     notion_page_id = Column(String(255), nullable=False)
@@ -81,7 +93,7 @@ class SyncState(Base):
     keep_modified_at = Column(DateTime, nullable=False)
     
     __table_args__ = (
-        Index('idx_sync_state_user_note', 'user_id', 'keep_note_id', unique=True),
+        UniqueConstraint('user_id', 'keep_note_id'),
     )
 
 
@@ -100,13 +112,19 @@ class SyncLog(Base):
     """Model for sync_logs table."""
     __tablename__ = 'sync_logs'
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(BigIntegerPK, primary_key=True, autoincrement=True)
     job_id = Column(UUID(), ForeignKey('sync_jobs.job_id'), nullable=False)
     keep_note_id = Column(String(255), nullable=True)
-    level = Column(String(20), nullable=False)  # INFO, WARNING, ERROR
+    level = Column(String(20), nullable=False)  # sync_log_level enum in Postgres: INFO, WARNING, ERROR
     message = Column(Text, nullable=False)
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     
     __table_args__ = (
-        Index('idx_sync_logs_job_id', 'job_id'),
+        Index('idx_sync_logs_job_created', 'job_id', 'created_at'),
+        Index('idx_sync_logs_level_created', 'level', 'created_at'),
+        Index(
+            'idx_sync_logs_errors', 'created_at',
+            postgresql_where=text("level = 'ERROR'"),
+            sqlite_where=text("level = 'ERROR'"),
+        ),
     )